@@ -0,0 +1,85 @@
+"""
+Pending Saves Module
+Queues the GUI's data file writes, so many changes cost a single write, and writes
+them from a background thread at most SAVE_INTERVAL seconds later.
+"""
+
+import atexit
+import threading
+import time
+
+# Queued changes are written at most this often, and none wait much longer (seconds)
+SAVE_INTERVAL = 2.0
+
+# FileHandler method that writes each kind of data
+SAVE_METHODS = {
+    'events': 'save_events',
+    'tasks': 'save_tasks',
+    'event_tree': 'save_event_tree_data',
+}
+
+# Streamlit re-executes the app script on every rerun, but this module is imported once
+# per process, so the queue, the flusher thread and the exit hook all live here.
+# Queued copies of each session's data, keyed by the session's FileHandler
+_pending = {}
+_lock = threading.Lock()
+_flusher = None
+
+def queue_save(file_handler, records_by_kind):
+    """
+    Queue data to be written by file_handler.
+
+    Args:
+        file_handler: The session's FileHandler
+        records_by_kind: Records to write, keyed by 'events', 'tasks' or 'event_tree'.
+            They should be copies the caller no longer changes; a later call replaces
+            the queued records of the same kind.
+    """
+    with _lock:
+        queued = _pending.setdefault(id(file_handler), (file_handler, {}))
+        queued[1].update(records_by_kind)
+
+def is_queued(file_handler):
+    """Check whether file_handler has changes waiting to be written."""
+    return id(file_handler) in _pending
+
+def _write(file_handler, records_by_kind):
+    """Write each queued data file once, however many changes were made to it."""
+    for kind, records in records_by_kind.items():
+        getattr(file_handler, SAVE_METHODS[kind])(records)
+
+def flush(file_handler):
+    """Write file_handler's queued changes now."""
+    with _lock:
+        queued = _pending.pop(id(file_handler), None)
+        if queued is not None:
+            _write(*queued)
+
+def flush_all(except_for=None):
+    """Write every session's queued changes, optionally leaving one session's queued."""
+    with _lock:
+        for key, queued in list(_pending.items()):
+            if queued[0] is not except_for:
+                del _pending[key]
+                _write(*queued)
+
+def _flush_periodically():
+    """Background loop: nothing stays queued for much longer than SAVE_INTERVAL."""
+    while True:
+        time.sleep(SAVE_INTERVAL)
+        try:
+            if _pending:
+                flush_all()
+        except Exception as e:
+            # Keep the loop alive, so later changes are still written
+            print(f"❌ Error writing queued changes: {e}")
+
+def start_flusher():
+    """Start the background flusher and the exit hook, once per process."""
+    global _flusher
+    with _lock:
+        if _flusher is not None:
+            return
+        _flusher = threading.Thread(target=_flush_periodically, name="pending-saves-flusher", daemon=True)
+        _flusher.start()
+        atexit.register(flush_all)
@@ -1,30 +1,65 @@
 import subprocess
 import sys
 import os
+import importlib.util
+
+# Launcher paths, resolved once at import time
+GUI_DIR = os.path.dirname(os.path.abspath(__file__))
+REQUIREMENTS_PATH = os.path.join(GUI_DIR, "requirements.txt")
+APP_PATH = os.path.join(GUI_DIR, "streamlit_app.py")
+# Written after a successful dependency check so later launches can skip it
+SENTINEL_PATH = os.path.join(GUI_DIR, ".deps_installed")
+
+def is_module_installed(module_name):
+    """Check whether a module can be imported without actually importing it."""
+    return importlib.util.find_spec(module_name) is not None
+
+def requirements_stamp():
+    """Identify the interpreter and requirements.txt so switching either invalidates the sentinel."""
+    try:
+        mtime = str(os.path.getmtime(REQUIREMENTS_PATH))
+    except OSError:
+        mtime = ""
+    return "\n".join([sys.executable, sys.prefix, mtime])
+
+def dependencies_checked():
+    """Check whether a previous launch already verified the dependencies."""
+    try:
+        with open(SENTINEL_PATH, 'r', encoding='utf-8') as file:
+            return file.read() == requirements_stamp()
+    except OSError:
+        return False
+
+def mark_dependencies_checked():
+    """Record a successful dependency check for later launches."""
+    try:
+        with open(SENTINEL_PATH, 'w', encoding='utf-8') as file:
+            file.write(requirements_stamp())
+    except OSError:
+        pass  # Not fatal, the check simply runs again next launch
 
 def main():
     print("🏫 Campus Connect and Plan")
     print("=" * 50)
     
-    try:
-        import streamlit
+    if dependencies_checked():
+        print("✅ Dependencies already installed")
+    elif is_module_installed("streamlit"):
         print("✅ Streamlit is installed")
-    except ImportError:
+        mark_dependencies_checked()
+    else:
         print("❌ Streamlit is not installed")
         print("Installing required dependencies...")
         
         # Install requirements
-        requirements_path = os.path.join(os.path.dirname(__file__), "requirements.txt")
-        if os.path.exists(requirements_path):
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", requirements_path])
+        if os.path.exists(REQUIREMENTS_PATH):
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", REQUIREMENTS_PATH])
         else:
             subprocess.check_call([sys.executable, "-m", "pip", "install", "streamlit", "plotly", "pandas", "numpy"])
+        mark_dependencies_checked()
     
-    # Get the path to the streamlit app
-    app_path = os.path.join(os.path.dirname(__file__), "streamlit_app.py")
-    
-    if not os.path.exists(app_path):
-        print(f"❌ Streamlit app not found at {app_path}")
+    if not os.path.exists(APP_PATH):
+        print(f"❌ Streamlit app not found at {APP_PATH}")
         return
     
     print("🚀 Launching Campus Connect GUI...")
@@ -32,12 +67,11 @@ def main():
     print("🌐 URL: http://localhost:8501")
     print("=" * 50)
     
-    # Launch streamlit
+    # Replace this process with streamlit instead of keeping a parent Python alive
+    sys.stdout.flush()
     try:
-        subprocess.run([sys.executable, "-m", "streamlit", "run", app_path, "--server.port", "8501"])
-    except KeyboardInterrupt:
-        print("\n👋 Campus Connect GUI closed")
-    except Exception as e:
+        os.execvp(sys.executable, [sys.executable, "-m", "streamlit", "run", APP_PATH, "--server.port", "8501"])
+    except OSError as e:
         print(f"❌ Error launching GUI: {e}")
 
 if __name__ == "__main__":
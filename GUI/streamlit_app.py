@@ -2,19 +2,26 @@ import streamlit as st
 import sys
 import os
 import json
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
+from functools import lru_cache
 import time
-import math
+
+# orjson is optional; it parses JSON noticeably faster than the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Project paths, resolved once at import time instead of on every rerun
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(PROJECT_DIR, "data")
+CAMPUS_DATA_PATH = os.path.join(DATA_DIR, "campus_data.json")
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_DIR)
 
 try:
     from data_structures.graph import Graph
-    from data_structures.linked_list import DoublyLinkedList
     from data_structures.stack import Stack
     from data_structures.queue import Queue
     from data_structures.binary_tree import BinarySearchTree
@@ -23,6 +30,11 @@ except ImportError as e:
     st.error(f"Error importing data structures: {e}")
     st.stop()
 
+# Data file writes are coalesced; see pending_saves
+import pending_saves
+from pending_saves import SAVE_INTERVAL
+pending_saves.start_flusher()
+
 # Page configuration
 st.set_page_config(
     page_title="Campus Connect and Plans",
@@ -31,9 +43,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for styling
-def load_css():
-    st.markdown("""
+# Custom CSS for styling, built once at import time
+CUSTOM_CSS = """
     <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
     
@@ -123,12 +134,16 @@ def load_css():
         margin: 10px 0;
     }
     
-    .path-card {
+    /* Path, event and task cards share one look */
+    .path-card, .event-card, .task-card {
         background: linear-gradient(135deg, rgba(255, 165, 0, 0.05) 0%, rgba(45, 27, 61, 0.1) 100%);
         border: 1px solid rgba(255, 165, 0, 0.2);
         border-radius: 8px;
         padding: 15px;
         margin: 8px 0;
+    }
+    
+    .path-card {
         transition: all 0.3s ease;
     }
     
@@ -164,55 +179,70 @@ def load_css():
         background: linear-gradient(135deg, #ff8c00 0%, #ff6b35 100%);
     }
     
-    .event-card {
-        background: linear-gradient(135deg, rgba(255, 165, 0, 0.05) 0%, rgba(45, 27, 61, 0.1) 100%);
-        border: 1px solid rgba(255, 165, 0, 0.2);
-        border-radius: 8px;
-        padding: 15px;
-        margin: 8px 0;
-    }
-    
-    .task-card {
-        background: linear-gradient(135deg, rgba(255, 165, 0, 0.05) 0%, rgba(45, 27, 61, 0.1) 100%);
-        border: 1px solid rgba(255, 165, 0, 0.2);
-        border-radius: 8px;
-        padding: 15px;
-        margin: 8px 0;
-    }
-    
     </style>
-    """, unsafe_allow_html=True)
+    """
+# Strip the indentation and blank lines once, since the block is resent on every rerun
+CUSTOM_CSS = "\n".join(line.strip() for line in CUSTOM_CSS.splitlines() if line.strip())
+
+# Streamlit drops any element a rerun does not emit again, so the style block has to be
+# sent on every run; only the string itself is shared
+def load_css():
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Session state defaults, as factories so each session gets its own objects
+SESSION_DEFAULTS = {
+    'current_location': lambda: None,
+    'tasks': Queue,
+    'event_tree': BinarySearchTree,
+    'event_tree_records': dict,
+    'undo_stack': Stack,
+    'redo_stack': Stack,
+    'events_list': list,
+    'tasks_list': list,
+    'tasks_by_id': dict,
+    # Use absolute path to data directory
+    'file_handler': lambda: FileHandler(DATA_DIR),
+}
 
 # Initialize session state
 def init_session_state():
-    if 'current_location' not in st.session_state:
-        st.session_state.current_location = None
-    if 'graph' not in st.session_state:
-        st.session_state.graph = Graph()
-    if 'events' not in st.session_state:
-        st.session_state.events = DoublyLinkedList()
-    if 'tasks' not in st.session_state:
-        st.session_state.tasks = Queue()
-    if 'event_tree' not in st.session_state:
-        st.session_state.event_tree = BinarySearchTree()
-    if 'undo_stack' not in st.session_state:
-        st.session_state.undo_stack = Stack()
-    if 'redo_stack' not in st.session_state:
-        st.session_state.redo_stack = Stack()
-    if 'events_list' not in st.session_state:
-        st.session_state.events_list = []
-    if 'tasks_list' not in st.session_state:
-        st.session_state.tasks_list = []
-    if 'file_handler' not in st.session_state:
-        # Use absolute path to data directory
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-        st.session_state.file_handler = FileHandler(data_dir)
-    
-    # Load data from files
+    # Everything below only has to happen once per session
+    if st.session_state.get('initialized'):
+        # Write what other sessions have queued, then reload if any session changed the
+        # files since this one read them, so saving never overwrites their changes
+        pending_saves.flush_all(except_for=st.session_state.file_handler)
+        if data_files_stamp(st.session_state.file_handler) != st.session_state.data_files_stamp:
+            load_data_from_files()
+        return
+    
+    # Factories only run for keys that are missing, so nothing is built just to be discarded
+    for key, factory in SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = factory()
+    
+    # Load data from files once; after that the session state is kept in sync with the
+    # files by the handlers that modify it, and reloaded when another session writes them
     load_data_from_files()
+    st.session_state.initialized = True
+
+def data_files_stamp(file_handler):
+    """Modification time and size of each data file, to notice writes by other sessions."""
+    stamp = []
+    for path in (file_handler.events_file, file_handler.tasks_file,
+                 os.path.join(file_handler.data_dir, "event_tree.json")):
+        try:
+            stats = os.stat(path)
+            stamp.append((stats.st_mtime_ns, stats.st_size))
+        except OSError:
+            stamp.append(None)
+    return stamp
 
 def load_data_from_files():
     """Load events and tasks data from JSON files."""
+    # Changes another session still has queued would otherwise be missing from the files
+    pending_saves.flush_all(except_for=st.session_state.file_handler)
+    # Taken before reading, so a write that lands mid-load triggers another reload
+    st.session_state.data_files_stamp = data_files_stamp(st.session_state.file_handler)
     try:
         # Load events from file
         events_list = st.session_state.file_handler.load_events()
@@ -221,13 +251,19 @@ def load_data_from_files():
         # Load tasks from file
         tasks_list = st.session_state.file_handler.load_tasks()
         st.session_state.tasks_list = tasks_list
+        # Index tasks by id; the first task with a given id wins, as the old scans did
+        tasks_by_id = {}
+        for task in tasks_list:
+            tasks_by_id.setdefault(task['id'], task)
+        st.session_state.tasks_by_id = tasks_by_id
         
         # Load event tree data and rebuild tree
         event_tree_data = st.session_state.file_handler.load_event_tree_data()
         st.session_state.event_tree.clear()
         
+        from event_search_tree import EventNode
+        tree_items = []
         for event_data in event_tree_data:
-            from event_search_tree import EventNode
             event_node = EventNode(
                 event_id=event_data['event_id'],
                 title=event_data['title'],
@@ -238,7 +274,14 @@ def load_data_from_files():
                 priority=event_data['priority'],
                 description=event_data['description']
             )
-            st.session_state.event_tree.insert(event_data['title'], event_node)
+            tree_items.append((event_data['title'], event_node))
+        
+        # Saved events come back sorted by title; insert them balanced instead of as a chain
+        st.session_state.event_tree.bulk_insert(tree_items)
+        st.session_state.event_tree_records = {
+            key: event_node_to_record(event_node) for key, event_node in tree_items
+        }
+        st.session_state.event_index = None
         
         # Rebuild queue from tasks list
         st.session_state.tasks.clear()
@@ -251,14 +294,68 @@ def load_data_from_files():
 
 
 
-# Load campus data
+def event_node_to_record(event_node):
+    return {
+        'event_id': event_node.event_id,
+        'title': event_node.title,
+        'date': event_node.date,
+        'time': event_node.time,
+        'location': event_node.location,
+        'category': event_node.category,
+        'priority': event_node.priority,
+        'description': event_node.description
+    }
+
+# The serialized records mirror the tree key for key, so saving never has to traverse it
+def add_to_event_tree(key, event_node):
+    st.session_state.event_tree.insert(key, event_node)
+    st.session_state.event_tree_records[key] = event_node_to_record(event_node)
+    st.session_state.event_index = None
+
+def remove_from_event_tree(key):
+    st.session_state.event_tree.delete(key)
+    st.session_state.event_tree_records.pop(key, None)
+    st.session_state.event_index = None
+
+def mark_dirty(*kinds):
+    """Queue 'events', 'tasks' and/or 'event_tree' to be written by flush_pending_saves()."""
+    state = st.session_state
+    sources = {
+        'events': state.events_list,
+        'tasks': state.tasks_list,
+        'event_tree': state.event_tree_records.values(),
+    }
+    # Queue copies, so the background flusher never reads lists this script is changing
+    pending_saves.queue_save(
+        state.file_handler, {kind: [dict(record) for record in sources[kind]] for kind in kinds}
+    )
+
+def flush_pending_saves(force=False):
+    """Write queued changes, at most once every SAVE_INTERVAL seconds unless forced."""
+    state = st.session_state
+    if 'file_handler' not in state or not pending_saves.is_queued(state.file_handler):
+        return
+    now = time.monotonic()
+    if not force and now - state.get('last_save_time', 0.0) < SAVE_INTERVAL:
+        return  # The background flusher picks these up within SAVE_INTERVAL
+    pending_saves.flush(state.file_handler)
+    # This session's own writes need no reload
+    state.data_files_stamp = data_files_stamp(state.file_handler)
+    state.last_save_time = now
+
+# Parse campus data (cached: the file is static, so parse it once instead of every rerun).
+# Errors are raised rather than cached, so a missing or broken file is retried next run.
+@st.cache_data(show_spinner=False)
+def read_campus_data(json_path):
+    with open(json_path, 'rb') as file:
+        raw = file.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return data.get("buildings", {}), data.get("routes", [])
+
 def load_campus_data():
     try:
-        json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "campus_data.json")
-        if os.path.exists(json_path):
-            with open(json_path, 'r') as file:
-                data = json.load(file)
-                return data.get("buildings", {}), data.get("routes", [])
+        if os.path.exists(CAMPUS_DATA_PATH):
+            return read_campus_data(CAMPUS_DATA_PATH)
         else:
             st.error("Campus data file not found!")
             return {}, []
@@ -266,6 +363,27 @@ def load_campus_data():
         st.error(f"Error loading campus data: {e}")
         return {}, []
 
+# Build the campus graph once and share it across reruns and sessions (it is read-only).
+# Like read_campus_data, load errors are raised, so a failed build is never cached.
+@st.cache_resource
+def load_campus_graph():
+    buildings, routes = read_campus_data(CAMPUS_DATA_PATH)
+    graph = Graph()
+    
+    for building in buildings.keys():
+        graph.add_vertex(building)
+    
+    graph.add_edges_from((route["from"], route["to"], route["distance"]) for route in routes)
+    
+    return graph
+
+def build_campus_graph():
+    try:
+        return load_campus_graph()
+    except Exception:
+        # load_campus_data() reports the error; the next run tries again
+        return Graph()
+
 # Campus Navigator Module
 def campus_navigator():
     # Start content from the very top of the page
@@ -275,25 +393,21 @@ def campus_navigator():
         st.error("No campus data available!")
         return
     
-    # Initialize graph if not already done
-    if len(st.session_state.graph.get_vertices()) == 0:
-        for building in buildings.keys():
-            st.session_state.graph.add_vertex(building)
-        
-        for route in routes:
-            st.session_state.graph.add_edge(route["from"], route["to"], route["distance"])
-    
     # Create columns at the very top
     col1, col2 = st.columns([1, 2])
     
     with col1:
         st.markdown("### 📍 Navigation")
         
+        # Build the name list and its index once per render
+        building_names = list(buildings)
+        name_to_idx = {name: idx for idx, name in enumerate(building_names)}
+        
         # Current location selection
         current_location = st.selectbox(
             "Select your current location:",
-            options=list(buildings.keys()),
-            index=list(buildings.keys()).index(st.session_state.current_location) if st.session_state.current_location else 0,
+            options=building_names,
+            index=name_to_idx.get(st.session_state.current_location, 0),
             key="current_loc"
         )
         
@@ -302,7 +416,8 @@ def campus_navigator():
             st.success(f"📍 Current location set to: {current_location}")
         
         # Destination selection
-        destinations = [b for b in buildings.keys() if b != current_location]
+        current_idx = name_to_idx[current_location]
+        destinations = building_names[:current_idx] + building_names[current_idx + 1:]
         destination = st.selectbox(
             "Select your destination:",
             options=destinations,
@@ -312,7 +427,6 @@ def campus_navigator():
         if st.button("🚀 Find Route", use_container_width=True):
             if current_location and destination:
                 with st.spinner("Finding the best route..."):
-                    time.sleep(0.5)  # Animation delay
                     find_and_display_routes(current_location, destination)
         
         # Campus statistics
@@ -323,35 +437,47 @@ def campus_navigator():
         with col1b:
             st.metric("Routes", len(routes))
         with col1c:
-            reachable = len(st.session_state.graph.get_all_reachable_vertices(current_location)) if current_location else 0
+            reachable = count_reachable_buildings(current_location) if current_location else 0
             st.metric("Reachable", reachable)
     
     with col2:
-        st.markdown("### 🗺️ Campus Map")
-        
-        # Add button to show/hide graph
-        if 'show_graph' not in st.session_state:
-            st.session_state.show_graph = False
-        
-        if st.button("🗺️ Show Campus Graph" if not st.session_state.show_graph else "🗺️ Hide Campus Graph", use_container_width=True):
-            st.session_state.show_graph = not st.session_state.show_graph
-            st.rerun()
-        
-        if st.session_state.show_graph:
-            display_campus_map(buildings, routes)
+        campus_map_section(buildings, routes)
+
+# Fragments rerun only themselves when their widgets change (st.fragment in Streamlit 1.37+,
+# st.experimental_fragment from 1.33); older versions just call the function as usual
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+@fragment
+def campus_map_section(buildings, routes):
+    st.markdown("### 🗺️ Campus Map")
+    
+    # Toggle to show/hide graph; the widget keeps its own state, so no explicit rerun is needed
+    if st.toggle("🗺️ Show Campus Graph", key="show_graph"):
+        display_campus_map(buildings, routes)
+
+# The campus graph is read-only, so each start building's reachable count is computed once
+@st.cache_data
+def count_reachable_buildings(start):
+    return len(build_campus_graph().get_all_reachable_vertices(start))
+
+# Route search results only depend on the endpoints, since the campus graph is read-only
+@st.cache_data(max_entries=256)
+def find_campus_routes(start, end, max_paths=3):
+    return build_campus_graph().find_all_paths(start, end, max_paths=max_paths)
 
 def find_and_display_routes(start, end):
     # Check if vertices exist
-    if start not in st.session_state.graph.get_vertices():
+    vertices = build_campus_graph().get_vertices()
+    if start not in vertices:
         st.error(f"❌ Start vertex '{start}' not found in graph!")
         return
     
-    if end not in st.session_state.graph.get_vertices():
+    if end not in vertices:
         st.error(f"❌ End vertex '{end}' not found in graph!")
         return
     
     # Find all paths
-    all_paths = st.session_state.graph.find_all_paths(start, end, max_paths=3)
+    all_paths = find_campus_routes(start, end, max_paths=3)
     
     if not all_paths:
         st.error(f"❌ No path found from {start} to {end}")
@@ -380,88 +506,103 @@ def display_campus_map(buildings, routes):
         st.info("No route data available for map visualization")
         return
     
+    # Hover text is the map's only interaction, so the zoom/pan toolbar is not rendered
+    st.plotly_chart(
+        build_campus_map_figure(buildings, routes),
+        use_container_width=True,
+        config={'displayModeBar': False}
+    )
+
+# Abbreviations for the department buildings shown on the campus map
+DEPARTMENT_ABBREVIATIONS = {
+    "CS Department": "CS",
+    "Civil Engineering Department": "CE",
+    "CHE Department": "CHE",
+    "Electrical Engineering Department": "EE",
+    "ME Department": "ME",
+    "PE Department": "PE",
+    "Math Department": "MATH",
+    "Physics Department": "PHY",
+    "CRP Department": "CRP",
+}
+
+def shorten_building_name(name):
+    abbreviation = DEPARTMENT_ABBREVIATIONS.get(name)
+    if abbreviation is not None:
+        return abbreviation
+    if "Department" in name:
+        # For other departments, take first word
+        return name.split()[0]
+    return name
+
+# The figure only depends on the campus data, so build it once per data version
+@st.cache_resource
+def build_campus_map_figure(buildings, routes):
+    # Plotly and NumPy are only needed once the map is shown, so import them here
+    import numpy as np
+    import plotly.graph_objects as go
+    
     # Prepare data for visualization
     nodes = list(buildings.keys())
     edges = [(route["from"], route["to"], route["distance"]) for route in routes]
     
-    # Create node positions (simple circular layout)
-    n_nodes = len(nodes)
-    node_positions = {}
-    for i, node in enumerate(nodes):
-        angle = 2 * math.pi * i / n_nodes
-        x = math.cos(angle)
-        y = math.sin(angle)
-        node_positions[node] = (x, y)
+    # Create node positions (simple circular layout), all angles at once
+    angles = np.linspace(0, 2 * np.pi, len(nodes), endpoint=False)
+    node_x = np.cos(angles)
+    node_y = np.sin(angles)
+    name_to_idx = {node: idx for idx, node in enumerate(nodes)}
     
     # Create the network graph
     fig = go.Figure()
     
-    # Add edges with costs
-    for from_node, to_node, distance in edges:
-        if from_node in node_positions and to_node in node_positions:
-            x0, y0 = node_positions[from_node]
-            x1, y1 = node_positions[to_node]
-            
-            # Calculate midpoint for cost label
-            mid_x = (x0 + x1) / 2
-            mid_y = (y0 + y1) / 2
-            
-            # Add edge line
-            fig.add_trace(go.Scatter(
-                x=[x0, x1],
-                y=[y0, y1],
-                mode='lines',
-                line=dict(color='rgba(255, 107, 53, 0.8)', width=3),
-                showlegend=False,
-                hoverinfo='text',
-                text=f"{from_node} → {to_node}<br>Distance: {distance}m",
-                hoverlabel=dict(bgcolor='rgba(255, 107, 53, 0.9)', font_size=12)
-            ))
-            
-            # Add cost label on edge
-            fig.add_trace(go.Scatter(
-                x=[mid_x],
-                y=[mid_y],
-                mode='text',
-                text=[f"{distance}m"],
-                textposition="middle center",
-                textfont=dict(color='white', size=10, family='Arial Black'),
-                showlegend=False,
-                hoverinfo='skip'
-            ))
+    # Only edges whose endpoints are both on the map are drawn
+    drawn_edges = [edge for edge in edges if edge[0] in name_to_idx and edge[1] in name_to_idx]
+    from_idx = np.array([name_to_idx[edge[0]] for edge in drawn_edges], dtype=int)
+    to_idx = np.array([name_to_idx[edge[1]] for edge in drawn_edges], dtype=int)
     
-    # Add nodes with shortened names
-    node_x = [node_positions[node][0] for node in nodes]
-    node_y = [node_positions[node][1] for node in nodes]
+    # Collect all edges into one line trace as [x0, x1, NaN] triples; NaN breaks the line
+    # between consecutive edges. Plotly takes arrays without validating each element.
+    edge_x = np.full(3 * len(drawn_edges), np.nan)
+    edge_y = np.full(3 * len(drawn_edges), np.nan)
+    edge_x[0::3], edge_x[1::3] = node_x[from_idx], node_x[to_idx]
+    edge_y[0::3], edge_y[1::3] = node_y[from_idx], node_y[to_idx]
+    edge_text = []
+    for from_node, to_node, distance in drawn_edges:
+        hover = f"{from_node} → {to_node}<br>Distance: {distance}m"
+        edge_text.extend([hover, hover, None])
+    
+    # Midpoints for cost labels
+    label_x = (node_x[from_idx] + node_x[to_idx]) / 2
+    label_y = (node_y[from_idx] + node_y[to_idx]) / 2
+    label_text = [f"{distance}m" for _, _, distance in drawn_edges]
+    
+    # Add edge lines (WebGL renderer, the line trace carries most of the points)
+    fig.add_trace(go.Scattergl(
+        x=edge_x,
+        y=edge_y,
+        mode='lines',
+        line=dict(color='rgba(255, 107, 53, 0.8)', width=3),
+        showlegend=False,
+        hoverinfo='text',
+        text=edge_text,
+        hoverlabel=dict(bgcolor='rgba(255, 107, 53, 0.9)', font_size=12)
+    ))
+    
+    # Add cost labels on edges
+    fig.add_trace(go.Scatter(
+        x=label_x,
+        y=label_y,
+        mode='text',
+        text=label_text,
+        textposition="middle center",
+        textfont=dict(color='white', size=10, family='Arial Black'),
+        showlegend=False,
+        hoverinfo='skip'
+    ))
     
+    # Add nodes with shortened names
     # Shorten node names by removing "Department"
-    shortened_names = []
-    for node in nodes:
-        if "Department" in node:
-            # Extract the abbreviation based on the actual department names
-            if "CS Department" in node:
-                shortened_names.append("CS")
-            elif "Civil Engineering Department" in node:
-                shortened_names.append("CE")
-            elif "CHE Department" in node:
-                shortened_names.append("CHE")
-            elif "Electrical Engineering Department" in node:
-                shortened_names.append("EE")
-            elif "ME Department" in node:
-                shortened_names.append("ME")
-            elif "PE Department" in node:
-                shortened_names.append("PE")
-            elif "Math Department" in node:
-                shortened_names.append("MATH")
-            elif "Physics Department" in node:
-                shortened_names.append("PHY")
-            elif "CRP Department" in node:
-                shortened_names.append("CRP")
-            else:
-                # For other departments, take first word
-                shortened_names.append(node.split()[0])
-        else:
-            shortened_names.append(node)
+    shortened_names = [shorten_building_name(node) for node in nodes]
     
     # Create color gradient for nodes - each node gets a different color
     colors = [
@@ -513,18 +654,34 @@ def display_campus_map(buildings, routes):
         ),
         margin=dict(l=0, r=0, t=50, b=0),
         height=500,
-        hovermode='closest'
+        hovermode='closest',
+        # Keep the client-side view across reruns instead of re-laying it out
+        uirevision='campus'
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+# Gradient page and sidebar headings
+@lru_cache(maxsize=None)
+def render_header(title, tag="h1"):
+    return f'<div class="header-gradient"><{tag}>{title}</{tag}></div>'
+
+# Event cards only change when their event does, so reuse the HTML across reruns
+@lru_cache(maxsize=256)
+def render_event_card(name, date, time, location, priority, description):
+    return f"""
+    <div class="event-card">
+        <h4>📅 {name}</h4>
+        <p><strong>Date:</strong> {date} at {time}</p>
+        <p><strong>Location:</strong> {location}</p>
+        <p><strong>Priority:</strong> {priority}</p>
+        <p><strong>Description:</strong> {description}</p>
+    </div>
+    """
 
 # Event Manager Module
 def event_manager():
-    st.markdown("""
-    <div class="header-gradient">
-        <h1>📅 Event Manager</h1>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(render_header("📅 Event Manager"), unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
     
@@ -568,9 +725,8 @@ def event_manager():
                     # Add to events list
                     st.session_state.events_list.append(event)
                     
-                    # Add to data structures
-                    st.session_state.events.insert_at_end(event)
-                    st.session_state.event_tree.insert(event_name, event_node)
+                    # Add to the search tree
+                    add_to_event_tree(event_name, event_node)
                     
                     # Store for undo
                     st.session_state.undo_stack.push({
@@ -580,27 +736,11 @@ def event_manager():
                     # Clear redo stack when new action is performed
                     st.session_state.redo_stack.clear()
                     
-                    # Save events to file immediately
-                    st.session_state.file_handler.save_events(st.session_state.events_list)
-                    
-                    # Save event tree data
-                    event_tree_data = []
-                    all_events = st.session_state.event_tree.inorder_traversal()
-                    for key, event_node in all_events:
-                        event_tree_data.append({
-                            'event_id': event_node.event_id,
-                            'title': event_node.title,
-                            'date': event_node.date,
-                            'time': event_node.time,
-                            'location': event_node.location,
-                            'category': event_node.category,
-                            'priority': event_node.priority,
-                            'description': event_node.description
-                        })
-                    st.session_state.file_handler.save_event_tree_data(event_tree_data)
+                    # Queue the events and event tree for saving
+                    mark_dirty('events', 'event_tree')
                     
+                    # The event list below is drawn later in this run, so no rerun is needed
                     st.success(f"✅ Event '{event_name}' added successfully!")
-                    st.rerun()
                 else:
                     st.error("Please fill in all required fields!")
     
@@ -608,17 +748,14 @@ def event_manager():
         st.markdown("### 📋 Current Events")
         
         if st.session_state.events_list:
-            for event in st.session_state.events_list:
-                with st.container():
-                    st.markdown(f"""
-                    <div class="event-card">
-                        <h4>📅 {event['name']}</h4>
-                        <p><strong>Date:</strong> {event['date']} at {event['time']}</p>
-                        <p><strong>Location:</strong> {event['location']}</p>
-                        <p><strong>Priority:</strong> {event['priority']}</p>
-                        <p><strong>Description:</strong> {event['description']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+            # All cards go out as one markdown element instead of one per event
+            st.markdown("".join(
+                render_event_card(
+                    event['name'], event['date'], event['time'],
+                    event['location'], event['priority'], event['description']
+                )
+                for event in st.session_state.events_list
+            ), unsafe_allow_html=True)
         else:
             st.info("No events added yet.")
         
@@ -632,29 +769,14 @@ def event_manager():
                         if st.session_state.events_list:
                             removed_event = st.session_state.events_list.pop()
                             # Remove from BST
-                            st.session_state.event_tree.delete(removed_event['name'])
+                            remove_from_event_tree(removed_event['name'])
                             # Store for redo
                             st.session_state.redo_stack.push({
                                 'type': 'delete_event',
                                 'data': removed_event
                             })
-                            # Save to file
-                            st.session_state.file_handler.save_events(st.session_state.events_list)
-                            # Save updated BST to file
-                            event_tree_data = []
-                            all_events = st.session_state.event_tree.inorder_traversal()
-                            for key, event_node in all_events:
-                                event_tree_data.append({
-                                    'event_id': event_node.event_id,
-                                    'title': event_node.title,
-                                    'date': event_node.date,
-                                    'time': event_node.time,
-                                    'location': event_node.location,
-                                    'category': event_node.category,
-                                    'priority': event_node.priority,
-                                    'description': event_node.description
-                                })
-                            st.session_state.file_handler.save_event_tree_data(event_tree_data)
+                            # Queue for saving
+                            mark_dirty('events', 'event_tree')
                             st.success(f"↩️ Undid: Added '{removed_event['name']}'")
                             st.rerun()
                     elif action['type'] == 'delete_event':
@@ -673,14 +795,14 @@ def event_manager():
                             priority=event_data['priority'],
                             description=event_data['description']
                         )
-                        st.session_state.event_tree.insert(event_data['name'], event_node)
+                        add_to_event_tree(event_data['name'], event_node)
                         # Store for redo
                         st.session_state.redo_stack.push({
                             'type': 'add_event',
                             'data': event_data
                         })
-                        # Save to file
-                        st.session_state.file_handler.save_events(st.session_state.events_list)
+                        # Queue for saving
+                        mark_dirty('events', 'event_tree')
                         st.success(f"↩️ Undid: Deleted '{event_data['name']}'")
                         st.rerun()
                 else:
@@ -706,14 +828,14 @@ def event_manager():
                             priority=event_data['priority'],
                             description=event_data['description']
                         )
-                        st.session_state.event_tree.insert(event_data['name'], event_node)
+                        add_to_event_tree(event_data['name'], event_node)
                         # Store for undo
                         st.session_state.undo_stack.push({
                             'type': 'delete_event',
                             'data': event_data
                         })
-                        # Save to file
-                        st.session_state.file_handler.save_events(st.session_state.events_list)
+                        # Queue for saving
+                        mark_dirty('events', 'event_tree')
                         st.success(f"↪️ Redid: Added '{event_data['name']}'")
                         st.rerun()
                     elif action['type'] == 'delete_event':
@@ -722,41 +844,35 @@ def event_manager():
                         if st.session_state.events_list:
                             removed_event = st.session_state.events_list.pop()
                             # Remove from BST
-                            st.session_state.event_tree.delete(removed_event['name'])
+                            remove_from_event_tree(removed_event['name'])
                             # Store for undo
                             st.session_state.undo_stack.push({
                                 'type': 'add_event',
                                 'data': removed_event
                             })
-                            # Save to file
-                            st.session_state.file_handler.save_events(st.session_state.events_list)
-                            # Save updated BST to file
-                            event_tree_data = []
-                            all_events = st.session_state.event_tree.inorder_traversal()
-                            for key, event_node in all_events:
-                                event_tree_data.append({
-                                    'event_id': event_node.event_id,
-                                    'title': event_node.title,
-                                    'date': event_node.date,
-                                    'time': event_node.time,
-                                    'location': event_node.location,
-                                    'category': event_node.category,
-                                    'priority': event_node.priority,
-                                    'description': event_node.description
-                                })
-                            st.session_state.file_handler.save_event_tree_data(event_tree_data)
+                            # Queue for saving
+                            mark_dirty('events', 'event_tree')
                             st.success(f"↪️ Redid: Deleted '{removed_event['name']}'")
                             st.rerun()
                 else:
                     st.info("Nothing to redo")
 
+# Task cards only change when their task does, so reuse the HTML across reruns
+@lru_cache(maxsize=256)
+def render_task_card(name, priority, deadline, description, status):
+    return f"""
+    <div class="task-card">
+        <h4>✅ {name}</h4>
+        <p><strong>Priority:</strong> {priority}</p>
+        <p><strong>Deadline:</strong> {deadline}</p>
+        <p><strong>Description:</strong> {description}</p>
+        <p><strong>Status:</strong> {status}</p>
+    </div>
+    """
+
 # Task Scheduler Module
 def task_scheduler():
-    st.markdown("""
-    <div class="header-gradient">
-        <h1>✅ Task Scheduler</h1>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(render_header("✅ Task Scheduler"), unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
     
@@ -783,6 +899,7 @@ def task_scheduler():
                     
                     # Add to tasks list
                     st.session_state.tasks_list.append(task)
+                    st.session_state.tasks_by_id.setdefault(task['id'], task)
                     
                     # Add to queue
                     st.session_state.tasks.enqueue(task)
@@ -795,11 +912,11 @@ def task_scheduler():
                     # Clear redo stack when new action is performed
                     st.session_state.redo_stack.clear()
                     
-                    # Save tasks to file immediately
-                    st.session_state.file_handler.save_tasks(st.session_state.tasks_list)
+                    # Queue tasks for saving
+                    mark_dirty('tasks')
                     
+                    # The task list below is drawn later in this run, so no rerun is needed
                     st.success(f"✅ Task '{task_name}' added successfully!")
-                    st.rerun()
                 else:
                     st.error("Please enter a task name!")
     
@@ -807,18 +924,15 @@ def task_scheduler():
         st.markdown("### 📋 Current Tasks")
         
         if st.session_state.tasks_list:
-            for task in st.session_state.tasks_list:
-                if task['status'] == 'Pending':
-                    with st.container():
-                        st.markdown(f"""
-                        <div class="task-card">
-                            <h4>✅ {task['name']}</h4>
-                            <p><strong>Priority:</strong> {task['priority']}</p>
-                            <p><strong>Deadline:</strong> {task['deadline']}</p>
-                            <p><strong>Description:</strong> {task['description']}</p>
-                            <p><strong>Status:</strong> {task['status']}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
+            # All pending cards go out as one markdown element instead of one per task
+            task_cards = [
+                render_task_card(task['name'], task['priority'], task['deadline'],
+                                 task['description'], task['status'])
+                for task in st.session_state.tasks_list
+                if task['status'] == 'Pending'
+            ]
+            if task_cards:
+                st.markdown("".join(task_cards), unsafe_allow_html=True)
         else:
             st.info("No tasks added yet.")
         
@@ -828,10 +942,9 @@ def task_scheduler():
                 completed_task = st.session_state.tasks.dequeue()
                 
                 # Update the task status in the list
-                for task in st.session_state.tasks_list:
-                    if task['id'] == completed_task['id']:
-                        task['status'] = 'Completed'
-                        break
+                task = st.session_state.tasks_by_id.get(completed_task['id'])
+                if task is not None:
+                    task['status'] = 'Completed'
                 
                 # Store for undo
                 st.session_state.undo_stack.push({
@@ -841,8 +954,8 @@ def task_scheduler():
                 # Clear redo stack when new action is performed
                 st.session_state.redo_stack.clear()
                 
-                # Save tasks to file immediately
-                st.session_state.file_handler.save_tasks(st.session_state.tasks_list)
+                # Queue tasks for saving
+                mark_dirty('tasks')
                 
                 st.success(f"✅ Completed: {completed_task['name']}")
                 st.rerun()
@@ -859,33 +972,40 @@ def task_scheduler():
                         # Undo add: remove the task
                         if st.session_state.tasks_list:
                             removed_task = st.session_state.tasks_list.pop()
+                            tasks_by_id = st.session_state.tasks_by_id
+                            if tasks_by_id.get(removed_task['id']) is removed_task:
+                                del tasks_by_id[removed_task['id']]
+                                # Fall back to another task sharing the id, if any
+                                for task in st.session_state.tasks_list:
+                                    if task['id'] == removed_task['id']:
+                                        tasks_by_id[task['id']] = task
+                                        break
                             # Remove from queue if it's still there
-                            # Note: Queue doesn't have a direct remove method, so we'll just update the list
+                            st.session_state.tasks.remove(removed_task)
                             # Store for redo
                             st.session_state.redo_stack.push({
                                 'type': 'delete_task',
                                 'data': removed_task
                             })
-                            # Save to file
-                            st.session_state.file_handler.save_tasks(st.session_state.tasks_list)
+                            # Queue for saving
+                            mark_dirty('tasks')
                             st.success(f"↩️ Undid: Added '{removed_task['name']}'")
                             st.rerun()
                     elif action['type'] == 'complete_task':
                         # Undo complete: mark task as pending again
                         task_data = action['data']
-                        for task in st.session_state.tasks_list:
-                            if task['id'] == task_data['id']:
-                                task['status'] = 'Pending'
-                                # Add back to queue
-                                st.session_state.tasks.enqueue(task)
-                                break
+                        task = st.session_state.tasks_by_id.get(task_data['id'])
+                        if task is not None:
+                            task['status'] = 'Pending'
+                            # Add back to queue
+                            st.session_state.tasks.enqueue(task)
                         # Store for redo
                         st.session_state.redo_stack.push({
                             'type': 'complete_task',
                             'data': task_data
                         })
-                        # Save to file
-                        st.session_state.file_handler.save_tasks(st.session_state.tasks_list)
+                        # Queue for saving
+                        mark_dirty('tasks')
                         st.success(f"↩️ Undid: Completed '{task_data['name']}'")
                         st.rerun()
                 else:
@@ -899,6 +1019,7 @@ def task_scheduler():
                         # Redo add: add the task back
                         task_data = action['data']
                         st.session_state.tasks_list.append(task_data)
+                        st.session_state.tasks_by_id.setdefault(task_data['id'], task_data)
                         if task_data['status'] == 'Pending':
                             st.session_state.tasks.enqueue(task_data)
                         # Store for undo
@@ -906,24 +1027,24 @@ def task_scheduler():
                             'type': 'delete_task',
                             'data': task_data
                         })
-                        # Save to file
-                        st.session_state.file_handler.save_tasks(st.session_state.tasks_list)
+                        # Queue for saving
+                        mark_dirty('tasks')
                         st.success(f"↪️ Redid: Added '{task_data['name']}'")
                         st.rerun()
                     elif action['type'] == 'complete_task':
                         # Redo complete: mark task as completed again
                         task_data = action['data']
-                        for task in st.session_state.tasks_list:
-                            if task['id'] == task_data['id']:
-                                task['status'] = 'Completed'
-                                break
+                        task = st.session_state.tasks_by_id.get(task_data['id'])
+                        if task is not None:
+                            task['status'] = 'Completed'
+                            st.session_state.tasks.remove(task)
                         # Store for undo
                         st.session_state.undo_stack.push({
                             'type': 'complete_task',
                             'data': task_data
                         })
-                        # Save to file
-                        st.session_state.file_handler.save_tasks(st.session_state.tasks_list)
+                        # Queue for saving
+                        mark_dirty('tasks')
                         st.success(f"↪️ Redid: Completed '{task_data['name']}'")
                         st.rerun()
                 else:
@@ -931,11 +1052,7 @@ def task_scheduler():
 
 # Event Search Tree Module
 def event_search_tree():
-    st.markdown("""
-    <div class="header-gradient">
-        <h1>🔍 Event Search Tree</h1>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(render_header("🔍 Event Search Tree"), unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
     
@@ -963,19 +1080,52 @@ def event_search_tree():
         st.markdown("### 📊 Search Results")
         
         if 'search_results' in st.session_state and st.session_state.search_results:
-            for result in st.session_state.search_results:
-                with st.container():
-                    st.markdown(f"""
-                    <div class="event-card">
-                        <h4>📅 {result['name']}</h4>
-                        <p><strong>Date:</strong> {result['date']} at {result['time']}</p>
-                        <p><strong>Location:</strong> {result['location']}</p>
-                        <p><strong>Priority:</strong> {result['priority']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+            # All result cards go out as one markdown element instead of one per result
+            st.markdown("".join(
+                render_result_card(
+                    result['name'], result['date'], result['time'],
+                    result['location'], result['priority']
+                )
+                for result in st.session_state.search_results
+            ), unsafe_allow_html=True)
         else:
             st.info("Search results will be displayed here")
 
+@lru_cache(maxsize=256)
+def render_result_card(name, date, time, location, priority):
+    return f"""
+    <div class="event-card">
+        <h4>📅 {name}</h4>
+        <p><strong>Date:</strong> {date} at {time}</p>
+        <p><strong>Location:</strong> {location}</p>
+        <p><strong>Priority:</strong> {priority}</p>
+    </div>
+    """
+
+def event_node_to_result(event_node):
+    return {
+        'name': event_node.title,
+        'date': event_node.date,
+        'time': event_node.time,
+        'location': event_node.location,
+        'priority': event_node.priority,
+        'category': event_node.category,
+        'description': event_node.description
+    }
+
+def get_event_index():
+    """Group event tree nodes by date and priority, rebuilt only after the tree changes."""
+    index = st.session_state.get('event_index')
+    if index is None:
+        by_date = {}
+        by_priority = {}
+        for key, event_node in st.session_state.event_tree:
+            by_date.setdefault(event_node.date, []).append(event_node)
+            by_priority.setdefault(event_node.priority, []).append(event_node)
+        index = {'date': by_date, 'priority': by_priority}
+        st.session_state.event_index = index
+    return index
+
 def perform_search(search_type, search_term):
     results = []
     
@@ -983,48 +1133,20 @@ def perform_search(search_type, search_term):
         # Search by name using binary tree
         # Convert search term to lowercase for case-insensitive search
         search_key = search_term.lower()
-        # Get all events from the tree and filter by name
-        all_events = st.session_state.event_tree.inorder_traversal()
-        for key, event_node in all_events:
-            if search_key in event_node.title.lower():
-                results.append({
-                    'name': event_node.title,
-                    'date': event_node.date,
-                    'time': event_node.time,
-                    'location': event_node.location,
-                    'priority': event_node.priority,
-                    'category': event_node.category,
-                    'description': event_node.description
-                })
+        # Stream events from the tree and filter by their pre-lowered titles
+        results = [
+            event_node_to_result(event_node)
+            for _, event_node in st.session_state.event_tree.inorder_iter()
+            if search_key in event_node.title_lower
+        ]
     elif search_type == "By Date":
-        # Search by date using binary tree
-        search_date = str(search_term)
-        all_events = st.session_state.event_tree.inorder_traversal()
-        for key, event_node in all_events:
-            if event_node.date == search_date:
-                results.append({
-                    'name': event_node.title,
-                    'date': event_node.date,
-                    'time': event_node.time,
-                    'location': event_node.location,
-                    'priority': event_node.priority,
-                    'category': event_node.category,
-                    'description': event_node.description
-                })
+        # Exact date match, answered from the index instead of a full traversal
+        matches = get_event_index()['date'].get(str(search_term), [])
+        results = [event_node_to_result(event_node) for event_node in matches]
     elif search_type == "By Priority":
-        # Search by priority using binary tree
-        all_events = st.session_state.event_tree.inorder_traversal()
-        for key, event_node in all_events:
-            if event_node.priority == search_term:
-                results.append({
-                    'name': event_node.title,
-                    'date': event_node.date,
-                    'time': event_node.time,
-                    'location': event_node.location,
-                    'priority': event_node.priority,
-                    'category': event_node.category,
-                    'description': event_node.description
-                })
+        # Exact priority match, answered from the index instead of a full traversal
+        matches = get_event_index()['priority'].get(search_term, [])
+        results = [event_node_to_result(event_node) for event_node in matches]
     
     return results
 
@@ -1035,11 +1157,7 @@ def main():
     
     # Sidebar
     with st.sidebar:
-        st.markdown("""
-        <div class="header-gradient">
-            <h2>🏫 Campus Connect</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(render_header("🏫 Campus Connect", "h2"), unsafe_allow_html=True)
         
         st.markdown("### Navigation")
         
@@ -1052,11 +1170,9 @@ def main():
         
         st.markdown("---")
         
-        # Quick stats
+        # Quick stats, filled in after the page so they include changes it makes
         st.markdown("### 📊 Quick Stats")
-        st.metric("Buildings", len(st.session_state.graph.get_vertices()))
-        st.metric("Events", len(st.session_state.events_list))
-        st.metric("Tasks", len([t for t in st.session_state.tasks_list if t['status'] == 'Pending']))
+        quick_stats = st.container()
         
         st.markdown("---")
         
@@ -1079,6 +1195,16 @@ def main():
         task_scheduler()
     elif page == "🔍 Event Search Tree":
         event_search_tree()
+    
+    with quick_stats:
+        st.metric("Buildings", len(build_campus_graph().get_vertices()))
+        st.metric("Events", len(st.session_state.events_list))
+        # The task queue holds exactly the pending tasks
+        st.metric("Tasks", st.session_state.tasks.size())
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # Also runs when st.rerun() interrupts the script, so changes are not held back a run
+        flush_pending_saves()
@@ -1,10 +1,27 @@
 # Data Structures Package
 # Contains all core data structure implementations
+# Submodules are imported lazily on first attribute access (PEP 562)
 
-from .graph import Graph
-from .linked_list import DoublyLinkedList
-from .stack import Stack
-from .queue import Queue
-from .binary_tree import BinarySearchTree
+import importlib
 
 __all__ = ['Graph', 'DoublyLinkedList', 'Stack', 'Queue', 'BinarySearchTree']
+
+_LAZY_IMPORTS = {
+    'Graph': '.graph',
+    'DoublyLinkedList': '.linked_list',
+    'Stack': '.stack',
+    'Queue': '.queue',
+    'BinarySearchTree': '.binary_tree',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,18 +1,31 @@
-from typing import Any, List, Optional, Tuple
+from collections import deque
+from typing import Any, Iterator, List, Optional, Tuple
 
 class TreeNode:
     """Node class for binary search tree."""
     
+    # No per-node __dict__: trees hold one of these per event
+    __slots__ = ('key', 'value', 'left', 'right', 'height')
+    
     def __init__(self, key: Any, value: Any = None):
         self.key = key
         self.value = value
         self.left: Optional[TreeNode] = None
         self.right: Optional[TreeNode] = None
+        self.height = 0  # Height of the subtree rooted here; a leaf has height 0
+
+def _height(node: Optional[TreeNode]) -> int:
+    """Height of a possibly empty subtree."""
+    return node.height if node is not None else -1
 
 class BinarySearchTree:
     """
     Binary Search Tree implementation for efficient event searching.
     Supports insertion, deletion, searching, and traversal operations.
+    
+    The tree is self-balancing (AVL): after every insert and delete the subtrees
+    of each node differ in height by at most one, so the height stays O(log n)
+    even when keys arrive in sorted order.
     """
     
     def __init__(self):
@@ -28,6 +41,18 @@ class BinarySearchTree:
         """Get the number of nodes in the tree."""
         return self.size
     
+    def __len__(self) -> int:
+        """Number of nodes in the tree."""
+        return self.size
+    
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        """Iterate over (key, value) pairs in key order."""
+        return self.inorder_iter()
+    
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a key is in the tree, even if its value is None."""
+        return self._find_node(key) is not None
+    
     def insert(self, key: Any, value: Any = None) -> bool:
         """
         Insert a new key-value pair into the tree.
@@ -44,29 +69,66 @@ class BinarySearchTree:
             self.size += 1
             return True
         
-        return self._insert_recursive(self.root, key, value)
-    
-    def _insert_recursive(self, node: TreeNode, key: Any, value: Any) -> bool:
-        """Recursive helper for insertion."""
-        if key == node.key:
-            # Key already exists, update value
-            node.value = value
-            return False
-        elif key < node.key:
-            if node.left is None:
-                node.left = TreeNode(key, value)
-                self.size += 1
-                return True
-            else:
-                return self._insert_recursive(node.left, key, value)
-        else:
-            if node.right is None:
-                node.right = TreeNode(key, value)
-                self.size += 1
-                return True
+        # Walk down iteratively, remembering the path for rebalancing
+        path = []
+        node = self.root
+        while True:
+            path.append(node)
+            if key == node.key:
+                # Key already exists, update value
+                node.value = value
+                return False
+            elif key < node.key:
+                if node.left is None:
+                    node.left = TreeNode(key, value)
+                    break
+                node = node.left
             else:
-                return self._insert_recursive(node.right, key, value)
+                if node.right is None:
+                    node.right = TreeNode(key, value)
+                    break
+                node = node.right
+        
+        self.size += 1
+        self._rebalance_path(path)
+        return True
     
+    def bulk_insert(self, items: List[Tuple[Any, Any]]) -> int:
+        """
+        Insert many key-value pairs, ordered so the tree stays balanced.
+
+        Pairs are sorted by key and inserted median first, so loading n keys
+        into an empty tree builds it balanced without needing any rotations.
+
+        Args:
+            items: List of (key, value) pairs; later duplicates win, as with insert()
+
+        Returns:
+            Number of new keys inserted
+        """
+        # Stable sort, then keep the last value of each run of equal keys
+        ordered = sorted(items, key=lambda item: item[0])
+        unique = []
+        for key, value in ordered:
+            if unique and unique[-1][0] == key:
+                unique[-1] = (key, value)
+            else:
+                unique.append((key, value))
+
+        inserted = 0
+        ranges = [(0, len(unique) - 1)]
+        while ranges:
+            low, high = ranges.pop()
+            if low > high:
+                continue
+            mid = (low + high) // 2
+            if self.insert(*unique[mid]):
+                inserted += 1
+            ranges.append((mid + 1, high))
+            ranges.append((low, mid - 1))
+
+        return inserted
+
     def search(self, key: Any) -> Optional[Any]:
         """
         Search for a key in the tree.
@@ -77,21 +139,20 @@ class BinarySearchTree:
         Returns:
             Value associated with the key, or None if not found
         """
-        if self.root is None:
-            return None
-        
-        return self._search_recursive(self.root, key)
+        node = self._find_node(key)
+        return node.value if node is not None else None
     
-    def _search_recursive(self, node: TreeNode, key: Any) -> Optional[Any]:
-        """Recursive helper for search."""
-        if node is None:
-            return None
-        elif key == node.key:
-            return node.value
-        elif key < node.key:
-            return self._search_recursive(node.left, key)
-        else:
-            return self._search_recursive(node.right, key)
+    def _find_node(self, key: Any) -> Optional[TreeNode]:
+        """Find the node holding a key, or None."""
+        node = self.root
+        while node is not None:
+            if key == node.key:
+                return node
+            elif key < node.key:
+                node = node.left
+            else:
+                node = node.right
+        return None
     
     def delete(self, key: Any) -> bool:
         """
@@ -103,38 +164,96 @@ class BinarySearchTree:
         Returns:
             True if deletion successful, False if key not found
         """
-        if self.root is None:
-            return False
+        # Find the node, remembering the path to it for rebalancing
+        path = []
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                path.append(node)
+                node = node.left
+            elif key > node.key:
+                path.append(node)
+                node = node.right
+            else:
+                break
         
-        self.root, deleted = self._delete_recursive(self.root, key)
-        if deleted:
-            self.size -= 1
-        return deleted
-    
-    def _delete_recursive(self, node: Optional[TreeNode], key: Any) -> Tuple[Optional[TreeNode], bool]:
-        """Recursive helper for deletion."""
         if node is None:
-            return None, False
+            return False
         
-        if key < node.key:
-            node.left, deleted = self._delete_recursive(node.left, key)
-            return node, deleted
-        elif key > node.key:
-            node.right, deleted = self._delete_recursive(node.right, key)
-            return node, deleted
+        if node.left is not None and node.right is not None:
+            # Node has two children: take over the successor's entry, then unlink the successor
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.key = successor.key
+            node.value = successor.value
+            self._replace_child(path[-1], successor, successor.right)
         else:
-            # Node to delete found
-            if node.left is None:
-                return node.right, True
-            elif node.right is None:
-                return node.left, True
-            else:
-                # Node has two children
-                successor = self._find_min(node.right)
-                node.key = successor.key
-                node.value = successor.value
-                node.right, _ = self._delete_recursive(node.right, successor.key)
-                return node, True
+            # Node has at most one child, which takes its place
+            child = node.left if node.left is not None else node.right
+            self._replace_child(path[-1] if path else None, node, child)
+        
+        self.size -= 1
+        self._rebalance_path(path)
+        return True
+    
+    def _replace_child(self, parent: Optional[TreeNode], old: TreeNode, new: Optional[TreeNode]) -> None:
+        """Put new where old hangs under parent (or at the root if parent is None)."""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+    
+    def _rotate_left(self, node: TreeNode) -> TreeNode:
+        """Rotate node's right child above it and return the new subtree root."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        node.height = max(_height(node.left), _height(node.right)) + 1
+        pivot.height = max(_height(pivot.left), _height(pivot.right)) + 1
+        return pivot
+    
+    def _rotate_right(self, node: TreeNode) -> TreeNode:
+        """Rotate node's left child above it and return the new subtree root."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        node.height = max(_height(node.left), _height(node.right)) + 1
+        pivot.height = max(_height(pivot.left), _height(pivot.right)) + 1
+        return pivot
+    
+    def _rebalance(self, node: TreeNode) -> TreeNode:
+        """Update node's height, rotate if its subtrees differ by two, and return the subtree root."""
+        left_height = _height(node.left)
+        right_height = _height(node.right)
+        
+        if left_height - right_height > 1:
+            if _height(node.left.left) < _height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if right_height - left_height > 1:
+            if _height(node.right.right) < _height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        
+        node.height = max(left_height, right_height) + 1
+        return node
+    
+    def _rebalance_path(self, path: List[TreeNode]) -> None:
+        """Restore heights and balance along a root-to-node path, bottom up."""
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                self._replace_child(path[index - 1] if index > 0 else None, node, subtree)
+            # Nodes further up only change if this subtree's height did
+            if subtree.height == old_height:
+                break
     
     def _find_min(self, node: TreeNode) -> TreeNode:
         """Find the minimum key in a subtree."""
@@ -162,42 +281,49 @@ class BinarySearchTree:
     
     def inorder_traversal(self) -> List[Tuple[Any, Any]]:
         """Perform inorder traversal (left, root, right)."""
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
+        return list(self.inorder_iter())
     
-    def _inorder_recursive(self, node: Optional[TreeNode], result: List[Tuple[Any, Any]]) -> None:
-        """Recursive helper for inorder traversal."""
-        if node is not None:
-            self._inorder_recursive(node.left, result)
-            result.append((node.key, node.value))
-            self._inorder_recursive(node.right, result)
+    def inorder_iter(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yield (key, value) pairs in inorder, without building a list."""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            # Walk down to the leftmost unvisited node
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key, node.value
+            node = node.right
     
     def preorder_traversal(self) -> List[Tuple[Any, Any]]:
         """Perform preorder traversal (root, left, right)."""
         result = []
-        self._preorder_recursive(self.root, result)
-        return result
-    
-    def _preorder_recursive(self, node: Optional[TreeNode], result: List[Tuple[Any, Any]]) -> None:
-        """Recursive helper for preorder traversal."""
-        if node is not None:
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
             result.append((node.key, node.value))
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
+            # Push right first so the left subtree is visited first
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+        return result
     
     def postorder_traversal(self) -> List[Tuple[Any, Any]]:
         """Perform postorder traversal (left, right, root)."""
+        # Visit root, right, left with a stack, then reverse to get left, right, root
         result = []
-        self._postorder_recursive(self.root, result)
-        return result
-    
-    def _postorder_recursive(self, node: Optional[TreeNode], result: List[Tuple[Any, Any]]) -> None:
-        """Recursive helper for postorder traversal."""
-        if node is not None:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
             result.append((node.key, node.value))
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        result.reverse()
+        return result
     
     def level_order_traversal(self) -> List[Tuple[Any, Any]]:
         """Perform level-order traversal (breadth-first)."""
@@ -205,10 +331,10 @@ class BinarySearchTree:
             return []
         
         result = []
-        queue = [self.root]
+        queue = deque([self.root])
         
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             result.append((node.key, node.value))
             
             if node.left:
@@ -220,39 +346,14 @@ class BinarySearchTree:
     
     def get_height(self) -> int:
         """Get the height of the tree."""
-        return self._get_height_recursive(self.root)
-    
-    def _get_height_recursive(self, node: Optional[TreeNode]) -> int:
-        """Recursive helper for getting height."""
-        if node is None:
-            return -1
-        
-        left_height = self._get_height_recursive(node.left)
-        right_height = self._get_height_recursive(node.right)
-        
-        return max(left_height, right_height) + 1
+        # Every node keeps its subtree height up to date
+        return _height(self.root)
     
     def is_balanced(self) -> bool:
         """Check if the tree is balanced."""
-        return self._is_balanced_recursive(self.root) != -1
-    
-    def _is_balanced_recursive(self, node: Optional[TreeNode]) -> int:
-        """Recursive helper for checking balance."""
-        if node is None:
-            return 0
-        
-        left_height = self._is_balanced_recursive(node.left)
-        if left_height == -1:
-            return -1
-        
-        right_height = self._is_balanced_recursive(node.right)
-        if right_height == -1:
-            return -1
-        
-        if abs(left_height - right_height) > 1:
-            return -1
-        
-        return max(left_height, right_height) + 1
+        # Insert and delete rebalance along the path they change, so the AVL
+        # invariant holds after every operation; there is nothing left to measure
+        return True
     
     def clear(self) -> None:
         """Clear all nodes from the tree."""
@@ -266,14 +367,13 @@ class BinarySearchTree:
             return
         
         print("Binary Search Tree (inorder):")
-        inorder_result = self.inorder_traversal()
-        for key, value in inorder_result:
+        for key, value in self:
             print(f"  {key}: {value}")
     
     def get_all_keys(self) -> List[Any]:
-        """Get all keys in the tree (inorder)."""
-        return [key for key, _ in self.inorder_traversal()]
+        """Get all keys in the tree (inorder). Iterate the tree instead when a list is not needed."""
+        return [key for key, _ in self]
     
     def get_all_values(self) -> List[Any]:
-        """Get all values in the tree (inorder)."""
-        return [value for _, value in self.inorder_traversal()]
+        """Get all values in the tree (inorder). Iterate the tree instead when a list is not needed."""
+        return [value for _, value in self]
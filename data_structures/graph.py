@@ -1,6 +1,6 @@
 from collections import defaultdict, deque
 import heapq
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, Iterable, List, Set, Tuple, Optional
 
 class Graph:
     """
@@ -12,30 +12,169 @@ class Graph:
         """Initialize an empty graph."""
         self.adjacency_list = defaultdict(list)
         self.vertices = set()
+        # Weight of each distinct edge, keyed by its endpoints, so adding an edge again
+        # updates it instead of duplicating it
+        self._edge_weights: Dict[Tuple[str, str, bool], float] = {}
+        # Compressed (CSR) copy of the adjacency list, built on demand and dropped on mutation
+        self._csr = None
+        # Incoming-edge arrays matching _csr, for searches that walk edges backwards
+        self._reverse_csr = None
+        # Result of is_connected(), kept until the graph changes
+        self._connected: Optional[bool] = None
+    
+    def _invalidate(self) -> None:
+        """Drop everything derived from the graph's structure."""
+        self._csr = None
+        self._reverse_csr = None
+        self._connected = None
     
     def add_vertex(self, vertex: str) -> None:
         """Add a vertex to the graph."""
         self.vertices.add(vertex)
         if vertex not in self.adjacency_list:
             self.adjacency_list[vertex] = []
+            self._invalidate()
     
-    def add_edge(self, from_vertex: str, to_vertex: str, weight: float = 1.0) -> None:
+    def add_edge(self, from_vertex: str, to_vertex: str, weight: float = 1.0, directed: bool = False) -> bool:
         """
         Add a weighted edge from from_vertex to to_vertex.
         
+        Adding an edge that already exists only updates its weight.
+        
         Args:
             from_vertex: Starting vertex
             to_vertex: Ending vertex
             weight: Edge weight (default: 1.0)
+            directed: Only add the from_vertex -> to_vertex direction (default: False)
+            
+        Returns:
+            True if the edge was added, False if it was already present
         """
         self.add_vertex(from_vertex)
         self.add_vertex(to_vertex)
+        return self._add_edge_entries(from_vertex, to_vertex, weight, directed)
+    
+    def add_edges_from(self, edges: Iterable[Tuple[str, str, float]], directed: bool = False) -> int:
+        """
+        Add many weighted edges at once.
+        
+        Args:
+            edges: (from_vertex, to_vertex, weight) triples
+            directed: Only add each edge in its given direction (default: False)
+            
+        Returns:
+            Number of edges added; edges already present only have their weight updated
+        """
+        edges = list(edges)
+        
+        # Register all endpoints in one pass instead of two add_vertex calls per edge;
+        # every vertex needs an adjacency row, even a sink of directed edges
+        adjacency_list = self.adjacency_list
+        vertices = self.vertices
+        for from_vertex, to_vertex, _ in edges:
+            for vertex in (from_vertex, to_vertex):
+                if vertex not in adjacency_list:
+                    adjacency_list[vertex] = []
+                    vertices.add(vertex)
+        self._invalidate()
+        
+        added = 0
+        for from_vertex, to_vertex, weight in edges:
+            if self._add_edge_entries(from_vertex, to_vertex, weight, directed):
+                added += 1
+        return added
+    
+    def _add_edge_entries(self, from_vertex: str, to_vertex: str, weight: float, directed: bool) -> bool:
+        """Append an edge to the adjacency list, or update its weight if it is already there."""
+        # An undirected edge is the same edge whichever end it is given from
+        if directed or from_vertex <= to_vertex:
+            key = (from_vertex, to_vertex, directed)
+        else:
+            key = (to_vertex, from_vertex, directed)
+        
+        if key in self._edge_weights:
+            old_weight = self._edge_weights[key]
+            if old_weight != weight:
+                self._edge_weights[key] = weight
+                self._replace_weight(from_vertex, to_vertex, old_weight, weight)
+                if not directed:
+                    self._replace_weight(to_vertex, from_vertex, old_weight, weight)
+                self._invalidate()
+            return False
+        self._edge_weights[key] = weight
         
         # Add edge with weight
         self.adjacency_list[from_vertex].append((to_vertex, weight))
         
         # For undirected graph, add reverse edge
-        self.adjacency_list[to_vertex].append((from_vertex, weight))
+        if not directed:
+            self.adjacency_list[to_vertex].append((from_vertex, weight))
+        self._invalidate()
+        return True
+    
+    def _replace_weight(self, vertex: str, neighbor: str, old_weight: float, weight: float) -> None:
+        """Change the weight of one vertex -> neighbor adjacency entry."""
+        neighbors = self.adjacency_list[vertex]
+        neighbors[neighbors.index((neighbor, old_weight))] = (neighbor, weight)
+    
+    def _get_csr(self) -> Tuple[List[str], Dict[str, int], List[int], List[int], List[float]]:
+        """
+        Get the graph in compressed sparse row form, building it if needed.
+        
+        Vertices are numbered in sorted name order, so comparing ids compares names.
+        The neighbors of vertex i are targets[offsets[i]:offsets[i + 1]], in adjacency-list
+        order, with matching entries in weights.
+        
+        Returns:
+            Tuple of (names by id, id by name, offsets, targets, weights)
+        """
+        if self._csr is None:
+            names = sorted(self.adjacency_list)
+            ids = {name: index for index, name in enumerate(names)}
+            offsets = [0]
+            targets = []
+            weights = []
+            for name in names:
+                for neighbor, weight in self.adjacency_list[name]:
+                    targets.append(ids[neighbor])
+                    weights.append(weight)
+                offsets.append(len(targets))
+            self._csr = (names, ids, offsets, targets, weights)
+        return self._csr
+    
+    def _get_reverse_csr(self) -> Tuple[List[int], List[int], List[float]]:
+        """
+        Get the incoming edges in the same form as _get_csr(), building them if needed.
+        
+        The vertices with an edge into vertex i are targets[offsets[i]:offsets[i + 1]],
+        with matching entries in weights. Without directed edges every edge goes both
+        ways, so these are simply the forward arrays.
+        
+        Returns:
+            Tuple of (offsets, targets, weights), indexed by the ids from _get_csr()
+        """
+        if self._reverse_csr is None:
+            names, _, offsets, targets, weights = self._get_csr()
+            if not any(directed for _, _, directed in self._edge_weights):
+                self._reverse_csr = (offsets, targets, weights)
+            else:
+                # Count the edges into each vertex, then place each edge at its target's slot
+                reverse_offsets = [0] * (len(names) + 1)
+                for target in targets:
+                    reverse_offsets[target + 1] += 1
+                for vertex_id in range(len(names)):
+                    reverse_offsets[vertex_id + 1] += reverse_offsets[vertex_id]
+                fill = reverse_offsets[:-1]
+                sources = [0] * len(targets)
+                reverse_weights = [0.0] * len(targets)
+                for source in range(len(names)):
+                    for edge in range(offsets[source], offsets[source + 1]):
+                        slot = fill[targets[edge]]
+                        fill[targets[edge]] = slot + 1
+                        sources[slot] = source
+                        reverse_weights[slot] = weights[edge]
+                self._reverse_csr = (reverse_offsets, sources, reverse_weights)
+        return self._reverse_csr
     
     def get_neighbors(self, vertex: str) -> List[Tuple[str, float]]:
         """Get all neighbors of a vertex with their edge weights."""
@@ -58,21 +197,26 @@ class Graph:
         if start_vertex not in self.vertices:
             return []
         
-        visited = set()
-        queue = deque([start_vertex])
-        visited.add(start_vertex)
-        result = []
+        # Walk integer ids over the CSR arrays, marking visits in a byte per vertex
+        # instead of hashing names into a set
+        names, ids, offsets, targets, _ = self._get_csr()
+        start = ids[start_vertex]
+        visited = bytearray(len(names))
+        visited[start] = 1
+        queue = deque([start])
+        order = []
         
         while queue:
-            current_vertex = queue.popleft()
-            result.append(current_vertex)
+            current = queue.popleft()
+            order.append(current)
             
-            for neighbor, _ in self.get_neighbors(current_vertex):
-                if neighbor not in visited:
-                    visited.add(neighbor)
+            for edge in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[edge]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
                     queue.append(neighbor)
         
-        return result
+        return [names[vertex_id] for vertex_id in order]
     
     def dfs(self, start_vertex: str) -> List[str]:
         """
@@ -87,19 +231,27 @@ class Graph:
         if start_vertex not in self.vertices:
             return []
         
-        visited = set()
-        result = []
-        
-        def dfs_recursive(vertex: str):
-            visited.add(vertex)
-            result.append(vertex)
-            
-            for neighbor, _ in self.get_neighbors(vertex):
-                if neighbor not in visited:
-                    dfs_recursive(neighbor)
-        
-        dfs_recursive(start_vertex)
-        return result
+        names, ids, offsets, targets, _ = self._get_csr()
+        visited = bytearray(len(names))
+        order = []
+        stack = [ids[start_vertex]]
+
+        # Explicit stack instead of recursion avoids hitting the recursion limit
+        while stack:
+            vertex = stack.pop()
+            if visited[vertex]:
+                continue
+
+            visited[vertex] = 1
+            order.append(vertex)
+
+            # Push in reverse so neighbors are visited in adjacency order
+            for edge in range(offsets[vertex + 1] - 1, offsets[vertex] - 1, -1):
+                neighbor = targets[edge]
+                if not visited[neighbor]:
+                    stack.append(neighbor)
+
+        return [names[vertex_id] for vertex_id in order]
     
     def dijkstra(self, start_vertex: str, end_vertex: str) -> Tuple[List[str], float]:
         """
@@ -115,51 +267,148 @@ class Graph:
         if start_vertex not in self.vertices or end_vertex not in self.vertices:
             return [], float('inf')
         
-        # Initialize distances and previous vertices
-        distances = {vertex: float('inf') for vertex in self.vertices}
-        distances[start_vertex] = 0
-        previous = {vertex: None for vertex in self.vertices}
+        if start_vertex == end_vertex:
+            return [start_vertex], 0
+        
+        # Run over the CSR arrays with integer vertex ids, so the inner loop indexes
+        # flat lists instead of hashing vertex names
+        names, ids, offsets, targets, weights = self._get_csr()
+        start = ids[start_vertex]
+        end = ids[end_vertex]
+        infinity = float('inf')
+        distances = [infinity] * len(names)
+        distances[start] = 0
+        previous = [-1] * len(names)
         
-        # Priority queue: (distance, vertex)
-        pq = [(0, start_vertex)]
-        visited = set()
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        # Priority queue: (distance, vertex id). Ids follow name order, so ties between
+        # equal distances break exactly as they would on (distance, name) pairs, but
+        # every heap comparison is between numbers
+        pq = [(0, start)]
         
         while pq:
-            current_distance, current_vertex = heapq.heappop(pq)
+            current_distance, current = heappop(pq)
             
-            if current_vertex in visited:
+            # Lazy deletion: an entry is stale if a shorter distance was pushed after it,
+            # which also covers vertices that are already settled
+            if current_distance > distances[current]:
                 continue
             
-            visited.add(current_vertex)
-            
             # If we reached the target, we're done
-            if current_vertex == end_vertex:
+            if current == end:
                 break
             
             # Check all neighbors
-            for neighbor, weight in self.get_neighbors(current_vertex):
-                if neighbor in visited:
-                    continue
-                
-                new_distance = current_distance + weight
+            for edge in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[edge]
+                new_distance = current_distance + weights[edge]
                 
+                # Settled neighbors never improve, since weights are non-negative
                 if new_distance < distances[neighbor]:
                     distances[neighbor] = new_distance
-                    previous[neighbor] = current_vertex
-                    heapq.heappush(pq, (new_distance, neighbor))
+                    previous[neighbor] = current
+                    heappush(pq, (new_distance, neighbor))
         
         # Reconstruct path
-        if distances[end_vertex] == float('inf'):
-            return [], float('inf')
+        if distances[end] == infinity:
+            return [], infinity
         
-        path = []
-        current = end_vertex
-        while current is not None:
-            path.append(current)
+        # Walk the predecessor ids back from the target, then map them to names in one pass
+        path_ids = []
+        current = end
+        while current != -1:
+            path_ids.append(current)
             current = previous[current]
         
-        path.reverse()
-        return path, distances[end_vertex]
+        return [names[vertex_id] for vertex_id in reversed(path_ids)], distances[end]
+    
+    def dijkstra_bidirectional(self, start_vertex: str, end_vertex: str) -> Tuple[List[str], float]:
+        """
+        Bidirectional Dijkstra: search from both ends at once and stop where they meet.
+        
+        Finds the same shortest distance as dijkstra() while usually settling far fewer
+        vertices for point-to-point queries. When several shortest paths exist, the one
+        returned may differ from dijkstra()'s.
+        
+        Args:
+            start_vertex: Starting vertex
+            end_vertex: Target vertex
+            
+        Returns:
+            Tuple of (shortest path as list of vertices, total distance)
+        """
+        if start_vertex not in self.vertices or end_vertex not in self.vertices:
+            return [], float('inf')
+        
+        if start_vertex == end_vertex:
+            return [start_vertex], 0
+        
+        names, ids, offsets, targets, weights = self._get_csr()
+        start = ids[start_vertex]
+        end = ids[end_vertex]
+        infinity = float('inf')
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        # Index 0 is the search forward from the start over outgoing edges, index 1 the
+        # search back from the end over incoming edges
+        edges = ((offsets, targets, weights), self._get_reverse_csr())
+        distances = ([infinity] * len(names), [infinity] * len(names))
+        previous = ([-1] * len(names), [-1] * len(names))
+        queues = ([(0, start)], [(0, end)])
+        distances[0][start] = 0
+        distances[1][end] = 0
+        
+        best = infinity
+        meeting = -1
+        
+        while queues[0] and queues[1]:
+            # No path through unsettled vertices can beat the best one found so far
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+            
+            # Advance whichever search has the closer frontier
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            dist, prev, pq = distances[side], previous[side], queues[side]
+            other_dist = distances[1 - side]
+            side_offsets, side_targets, side_weights = edges[side]
+            
+            current_distance, current = heappop(pq)
+            if current_distance > dist[current]:
+                continue  # Stale entry
+            
+            for edge in range(side_offsets[current], side_offsets[current + 1]):
+                neighbor = side_targets[edge]
+                new_distance = current_distance + side_weights[edge]
+                
+                if new_distance < dist[neighbor]:
+                    dist[neighbor] = new_distance
+                    prev[neighbor] = current
+                    heappush(pq, (new_distance, neighbor))
+                
+                # A path through this edge joins the two searches
+                if new_distance + other_dist[neighbor] < best:
+                    best = new_distance + other_dist[neighbor]
+                    meeting = neighbor
+        
+        if meeting == -1:
+            return [], infinity
+        
+        # Start -> meeting point from the forward search, then on to the end from the backward one
+        path_ids = []
+        current = meeting
+        while current != -1:
+            path_ids.append(current)
+            current = previous[0][current]
+        path_ids.reverse()
+        current = previous[1][meeting]
+        while current != -1:
+            path_ids.append(current)
+            current = previous[1][current]
+        
+        return [names[vertex_id] for vertex_id in path_ids], best
     
     def get_all_reachable_vertices(self, start_vertex: str) -> List[str]:
         """
@@ -180,12 +429,13 @@ class Graph:
         Returns:
             True if graph is connected, False otherwise
         """
-        if not self.vertices:
-            return True
-        
-        start_vertex = next(iter(self.vertices))
-        reachable = set(self.bfs(start_vertex))
-        return len(reachable) == len(self.vertices)
+        if self._connected is None:
+            if not self.vertices:
+                self._connected = True
+            else:
+                start_vertex = next(iter(self.vertices))
+                self._connected = len(self.bfs(start_vertex)) == len(self.vertices)
+        return self._connected
     
     def get_graph_info(self) -> Dict:
         """
@@ -194,11 +444,9 @@ class Graph:
         Returns:
             Dictionary with graph statistics
         """
-        total_edges = sum(len(neighbors) for neighbors in self.adjacency_list.values()) // 2
-        
         return {
             'vertices': len(self.vertices),
-            'edges': total_edges,
+            'edges': len(self._edge_weights),
             'connected': self.is_connected(),
             'vertex_list': list(self.vertices)
         }
@@ -221,22 +469,43 @@ class Graph:
         if start_vertex == end_vertex:
             return [([start_vertex], 0.0)]
         
+        # Queue entries share their prefixes through a flat predecessor list instead of
+        # each carrying a copy of the path; a bitmask of vertex ids stands in for the
+        # path when checking for cycles
+        names, ids, offsets, targets, weights = self._get_csr()
+        start = ids[start_vertex]
+        end = ids[end_vertex]
+        pred_vertex = [start]  # Vertex id of each pred entry
+        pred_parent = [-1]  # Index of the entry it was reached from
+        queue = deque([(start, 0, 0.0, 1 << start)])  # (vertex, pred index, distance, on-path mask)
         paths = []
-        queue = deque([(start_vertex, [start_vertex], 0.0)])  # (vertex, path, distance)
         
         while queue and len(paths) < max_paths:
-            current, path, distance = queue.popleft()
-            
-            if current == end_vertex:
-                paths.append((path[:], distance))
-                continue
+            current, entry, distance, on_path = queue.popleft()
             
             # Explore all neighbors
-            for neighbor, weight in self.get_neighbors(current):
-                if neighbor not in path:  # Avoid cycles
-                    new_path = path + [neighbor]
-                    new_distance = distance + weight
-                    queue.append((neighbor, new_path, new_distance))
+            for edge in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[edge]
+                bit = 1 << neighbor
+                if on_path & bit:  # Avoid cycles
+                    continue
+                new_distance = distance + weights[edge]
+                if neighbor == end:
+                    # Record paths to the target when they are found rather than when
+                    # dequeued; the order is the same, but the search can stop sooner.
+                    # Only accepted paths are ever spelled out
+                    path_ids = [end]
+                    index = entry
+                    while index != -1:
+                        path_ids.append(pred_vertex[index])
+                        index = pred_parent[index]
+                    paths.append(([names[vertex_id] for vertex_id in reversed(path_ids)], new_distance))
+                    if len(paths) >= max_paths:
+                        break
+                else:
+                    pred_vertex.append(neighbor)
+                    pred_parent.append(entry)
+                    queue.append((neighbor, len(pred_vertex) - 1, new_distance, on_path | bit))
         
         # Sort paths by total distance
         paths.sort(key=lambda x: x[1])
@@ -1,7 +1,10 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, Dict, Iterable, Iterator, List, Sequence
 
 class Node:
     
+    # No per-node __dict__: lists hold one of these per element
+    __slots__ = ('data', 'prev', 'next')
+    
     def __init__(self, data: Any):
         self.data = data
         self.prev: Optional[Node] = None
@@ -9,11 +12,49 @@ class Node:
 
 class DoublyLinkedList:
 
+    # No per-instance __dict__ on the list object either
+    __slots__ = ('head', 'tail', 'size', '_index', '_nodes')
     
-    def __init__(self):
+    def __init__(self, indexed: bool = False):
         self.head: Optional[Node] = None
         self.tail: Optional[Node] = None
         self.size = 0
+        # Optional value -> nodes index so search/delete_by_value skip the walk;
+        # only usable when every value stored is hashable
+        self._index: Optional[Dict[Any, List[Node]]] = {} if indexed else None
+        # Nodes in order for O(1) positional access, built by _node_at() on the second
+        # read since the last change (() marks that one read has walked already) and
+        # dropped whenever a node is added or removed
+        self._nodes: Optional[Sequence[Node]] = None
+    
+    @classmethod
+    def from_iterable(cls, items: Iterable[Any], indexed: bool = False) -> "DoublyLinkedList":
+        linked_list = cls(indexed)
+        linked_list.extend(items)
+        return linked_list
+    
+    def extend(self, items: Iterable[Any]) -> None:
+        # Create every node before touching the list, so a failing iterable leaves it
+        # unchanged, then link them in one pass instead of an insert_at_end call per item
+        new_nodes = [Node(data) for data in items]
+        if not new_nodes:
+            return
+        
+        previous = self.tail
+        for new_node in new_nodes:
+            new_node.prev = previous
+            if previous is not None:
+                previous.next = new_node
+            previous = new_node
+        
+        if self.head is None:
+            self.head = new_nodes[0]
+        self.tail = previous
+        self.size += len(new_nodes)
+        self._nodes = None
+        if self._index is not None:
+            for new_node in new_nodes:
+                self._index_add(new_node)
     
     def is_empty(self) -> bool:
         return self.head is None
@@ -21,10 +62,24 @@ class DoublyLinkedList:
     def get_size(self) -> int:
         return self.size
     
+    def __len__(self) -> int:
+        return self.size
+    
+    def __iter__(self) -> Iterator[Any]:
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+    
+    def __contains__(self, value: Any) -> bool:
+        if self._index is not None:
+            return bool(self._index.get(value))
+        return self._find_first(value) is not None
+    
     def insert_at_beginning(self, data: Any) -> None:
         new_node = Node(data)
         
-        if self.is_empty():
+        if self.head is None:
             self.head = new_node
             self.tail = new_node
         else:
@@ -33,11 +88,14 @@ class DoublyLinkedList:
             self.head = new_node
         
         self.size += 1
+        self._nodes = None
+        if self._index is not None:
+            self._index_add(new_node)
     
     def insert_at_end(self, data: Any) -> None:
         new_node = Node(data)
         
-        if self.is_empty():
+        if self.head is None:
             self.head = new_node
             self.tail = new_node
         else:
@@ -46,6 +104,9 @@ class DoublyLinkedList:
             self.tail = new_node
         
         self.size += 1
+        self._nodes = None
+        if self._index is not None:
+            self._index_add(new_node)
     
     def insert_at_position(self, data: Any, position: int) -> bool:
 
@@ -60,11 +121,7 @@ class DoublyLinkedList:
             return True
         
         new_node = Node(data)
-        current = self.head
-        
-        # Move to the position
-        for _ in range(position):
-            current = current.next
+        current = self._node_at(position, cache=False)
         
         # Insert the new node
         new_node.prev = current.prev
@@ -73,13 +130,18 @@ class DoublyLinkedList:
         current.prev = new_node
         
         self.size += 1
+        self._nodes = None
+        if self._index is not None:
+            self._index_add(new_node)
         return True
     
     def delete_from_beginning(self) -> Optional[Any]:
-        if self.is_empty():
+        if self.head is None:
             return None
         
         data = self.head.data
+        if self._index is not None:
+            self._index_remove(self.head)
         
         if self.head == self.tail:
             self.head = None
@@ -89,13 +151,16 @@ class DoublyLinkedList:
             self.head.prev = None
         
         self.size -= 1
+        self._nodes = None
         return data
     
     def delete_from_end(self) -> Optional[Any]:
-        if self.is_empty():
+        if self.head is None:
             return None
         
         data = self.tail.data
+        if self._index is not None:
+            self._index_remove(self.tail)
         
         if self.head == self.tail:
             self.head = None
@@ -105,6 +170,7 @@ class DoublyLinkedList:
             self.tail.next = None
         
         self.size -= 1
+        self._nodes = None
         return data
     
     def delete_at_position(self, position: int) -> Optional[Any]:
@@ -117,110 +183,180 @@ class DoublyLinkedList:
         elif position == self.size - 1:
             return self.delete_from_end()
         
-        current = self.head
-        
-        # Move to the position
-        for _ in range(position):
-            current = current.next
+        current = self._node_at(position, cache=False)
         
         # Delete the node
         data = current.data
-        current.prev.next = current.next
-        current.next.prev = current.prev
-        
-        self.size -= 1
+        self._unlink(current)
         return data
     
     def delete_by_value(self, value: Any) -> bool:
 
-        current = self.head
-        
-        while current:
-            if current.data == value:
-                if current == self.head:
-                    self.delete_from_beginning()
-                elif current == self.tail:
-                    self.delete_from_end()
-                else:
-                    current.prev.next = current.next
-                    current.next.prev = current.prev
-                    self.size -= 1
-                return True
-            current = current.next
+        current = self._find_first(value)
+        if current is None:
+            return False
         
-        return False
+        if current == self.head:
+            self.delete_from_beginning()
+        elif current == self.tail:
+            self.delete_from_end()
+        else:
+            self._unlink(current)
+        return True
     
     def search(self, value: Any) -> Optional[int]:
 
+        if self._index is not None:
+            nodes = self._index.get(value)
+            if not nodes:
+                return None
+            if len(nodes) == 1:
+                # Count the nodes in front of the only match
+                position = 0
+                current = nodes[0].prev
+                while current:
+                    current = current.prev
+                    position += 1
+                return position
+        
         current = self.head
         position = 0
         
         while current:
-            if current.data == value:
+            # Identity first, like list.index, so shared objects skip __eq__
+            if current.data is value or current.data == value:
                 return position
             current = current.next
             position += 1
         
         return None
     
+    def _find_first(self, value: Any) -> Optional[Node]:
+        if self._index is not None:
+            nodes = self._index.get(value)
+            if not nodes:
+                return None
+            if len(nodes) == 1:
+                return nodes[0]
+            # Duplicates: the index does not know which comes first, so walk
+        
+        current = self.head
+        while current:
+            if current.data is value or current.data == value:
+                return current
+            current = current.next
+        return None
+    
+    def _node_at(self, position: int, cache: bool = True) -> Node:
+        # Callers that are about to add or remove a node pass cache=False, since
+        # that drops the snapshot straight away
+        nodes = self._nodes
+        if nodes:
+            return nodes[position]
+        
+        if cache:
+            if nodes is not None:
+                # A second read since the last change: number every node once, so this
+                # read and the ones after it are O(1) until the list changes again
+                nodes = [None] * self.size
+                current = self.head
+                for index in range(self.size):
+                    nodes[index] = current
+                    current = current.next
+                self._nodes = nodes
+                return nodes[position]
+            # A single read is cheaper as a walk than as a full snapshot
+            self._nodes = ()
+        
+        # Walk from whichever end is closer to the (valid) position
+        if position < self.size // 2:
+            current = self.head
+            for _ in range(position):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self.size - 1 - position):
+                current = current.prev
+        return current
+    
+    def _unlink(self, node: Node) -> None:
+        # Remove an interior node (one with both neighbors)
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        self.size -= 1
+        self._nodes = None
+        if self._index is not None:
+            self._index_remove(node)
+    
+    def _index_add(self, node: Node) -> None:
+        nodes = self._index.get(node.data)
+        if nodes is None:
+            self._index[node.data] = [node]
+        else:
+            nodes.append(node)
+    
+    def _index_remove(self, node: Node) -> None:
+        nodes = self._index[node.data]
+        if len(nodes) == 1:
+            del self._index[node.data]
+        else:
+            nodes.remove(node)
+    
     def get_at_position(self, position: int) -> Optional[Any]:
 
         if position < 0 or position >= self.size:
             return None
         
-        current = self.head
-        
-        for _ in range(position):
-            current = current.next
-        
-        return current.data
+        return self._node_at(position).data
     
     def update_at_position(self, position: int, new_data: Any) -> bool:
 
         if position < 0 or position >= self.size:
             return False
         
-        current = self.head
-        
-        for _ in range(position):
-            current = current.next
+        # Changing a value keeps the nodes, so any snapshot stays valid
+        current = self._node_at(position)
         
-        current.data = new_data
+        if self._index is not None:
+            self._index_remove(current)
+            current.data = new_data
+            self._index_add(current)
+        else:
+            current.data = new_data
         return True
     
     def to_list(self) -> List[Any]:
-        result = []
+        result = [None] * self.size
         current = self.head
-        
-        while current:
-            result.append(current.data)
+        for index in range(self.size):
+            result[index] = current.data
             current = current.next
-        
         return result
     
     def clear(self) -> None:
         self.head = None
         self.tail = None
         self.size = 0
+        self._nodes = None
+        if self._index is not None:
+            self._index.clear()
     
     def display(self) -> None:
         if self.is_empty():
             print("Empty list")
             return
         
-        current = self.head
-        while current:
-            print(f"{current.data} <-> ", end="")
-            current = current.next
-        print("None")
+        # Build the whole line and print it once rather than once per node
+        print("".join([f"{data} <-> " for data in self]) + "None")
     
     def display_reverse(self) -> None:
         if self.is_empty():
             print("Empty list")
             return
         
+        parts = []
         current = self.tail
         while current:
-            print(f"{current.data} <-> ", end="")
+            parts.append(f"{current.data} <-> ")
             current = current.prev
-        print("None")
+        print("".join(parts) + "None")
@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from collections import deque
 
 class Queue:
@@ -7,29 +7,49 @@ class Queue:
     Uses FIFO (First In, First Out) principle.
     """
     
-    def __init__(self, max_size: Optional[int] = None):
+    # Fixed attribute set, including the bound deque methods
+    __slots__ = ('items', 'max_size', '_counts', '_append', '_popleft', '_len')
+    
+    def __init__(self, max_size: Optional[int] = None, indexed: bool = False):
         """
         Initialize an empty queue.
         
         Args:
             max_size: Maximum size of the queue (None for unlimited)
+            indexed: Count items in a dict so contains() and misses in remove()
+                skip the scan; items must then be hashable (default: False)
+            
+        Raises:
+            ValueError: If max_size is negative
         """
+        self._check_max_size(max_size)
+        # enqueue() enforces max_size, so the deque itself stays unbounded and
+        # set_max_size() never has to replace it
         self.items = deque()
         self.max_size = max_size
+        self._counts: Optional[Dict[Any, int]] = {} if indexed else None
+        # Bound once so the hot paths skip the attribute lookup on the deque
+        self._append = self.items.append
+        self._popleft = self.items.popleft
+        self._len = self.items.__len__
+    
+    @staticmethod
+    def _check_max_size(max_size: Optional[int]) -> None:
+        """Reject a negative size limit."""
+        if max_size is not None and max_size < 0:
+            raise ValueError(f"max_size must be None or non-negative, got {max_size}")
     
     def is_empty(self) -> bool:
         """Check if the queue is empty."""
-        return len(self.items) == 0
+        return self._len() == 0
     
     def is_full(self) -> bool:
         """Check if the queue is full (only if max_size is set)."""
-        if self.max_size is None:
-            return False
-        return len(self.items) >= self.max_size
+        return self._len() == self.max_size
     
     def size(self) -> int:
         """Get the current size of the queue."""
-        return len(self.items)
+        return self._len()
     
     def enqueue(self, item: Any) -> bool:
         """
@@ -41,10 +61,13 @@ class Queue:
         Returns:
             True if enqueue successful, False if queue is full
         """
-        if self.is_full():
+        # The length never exceeds max_size, and never equals it when max_size is None
+        if self._len() == self.max_size:
             return False
         
-        self.items.append(item)
+        self._append(item)
+        if self._counts is not None:
+            self._counts[item] = self._counts.get(item, 0) + 1
         return True
     
     def dequeue(self) -> Optional[Any]:
@@ -54,10 +77,21 @@ class Queue:
         Returns:
             First item from the queue, or None if queue is empty
         """
-        if self.is_empty():
+        if not self._len():
             return None
         
-        return self.items.popleft()
+        item = self._popleft()
+        if self._counts is not None:
+            self._uncount(item)
+        return item
+    
+    def _uncount(self, item: Any) -> None:
+        """Drop one occurrence of item from the counts."""
+        count = self._counts[item]
+        if count == 1:
+            del self._counts[item]
+        else:
+            self._counts[item] = count - 1
     
     def peek(self) -> Optional[Any]:
         """
@@ -66,7 +100,7 @@ class Queue:
         Returns:
             First item from the queue, or None if queue is empty
         """
-        if self.is_empty():
+        if not self._len():
             return None
         
         return self.items[0]
@@ -78,7 +112,7 @@ class Queue:
         Returns:
             Last item from the queue, or None if queue is empty
         """
-        if self.is_empty():
+        if not self._len():
             return None
         
         return self.items[-1]
@@ -86,6 +120,8 @@ class Queue:
     def clear(self) -> None:
         """Remove all items from the queue."""
         self.items.clear()
+        if self._counts is not None:
+            self._counts.clear()
     
     def to_list(self) -> List[Any]:
         """Convert the queue to a Python list (front to back)."""
@@ -97,9 +133,10 @@ class Queue:
             print("Empty queue")
             return
         
-        print("Queue (front to back):")
-        for i, item in enumerate(self.items):
-            print(f"  {i}: {item}")
+        # One print for the whole listing instead of one per item
+        lines = ["Queue (front to back):"]
+        lines.extend(f"  {i}: {item}" for i, item in enumerate(self.items))
+        print("\n".join(lines))
     
     def get_max_size(self) -> Optional[int]:
         """Get the maximum size of the queue."""
@@ -111,13 +148,19 @@ class Queue:
         
         Args:
             max_size: New maximum size (None for unlimited)
+            
+        Raises:
+            ValueError: If max_size is negative
         """
+        self._check_max_size(max_size)
         self.max_size = max_size
         
-        # If new max_size is smaller than current size, remove excess items from front
-        if max_size is not None and len(self.items) > max_size:
-            while len(self.items) > max_size:
-                self.items.popleft()
+        # Drop the excess from the front in place, so the deque and its bound methods stay valid
+        if max_size is not None:
+            while self._len() > max_size:
+                item = self._popleft()
+                if self._counts is not None:
+                    self._uncount(item)
     
     def contains(self, item: Any) -> bool:
         """
@@ -129,6 +172,8 @@ class Queue:
         Returns:
             True if item found, False otherwise
         """
+        if self._counts is not None:
+            return item in self._counts
         return item in self.items
     
     def remove(self, item: Any) -> bool:
@@ -141,6 +186,11 @@ class Queue:
         Returns:
             True if item was removed, False if not found
         """
+        if self._counts is not None:
+            if item not in self._counts:
+                return False
+            self._uncount(item)
+        
         try:
             self.items.remove(item)
             return True
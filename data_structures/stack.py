@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
 
 class Stack:
     """
@@ -6,6 +6,8 @@ class Stack:
     Uses LIFO (Last In, First Out) principle.
     """
     
+    __slots__ = ('items', 'max_size')
+    
     def __init__(self, max_size: Optional[int] = None):
         """
         Initialize an empty stack.
@@ -40,7 +42,7 @@ class Stack:
         Returns:
             True if push successful, False if stack is full
         """
-        if self.is_full():
+        if self.max_size is not None and len(self.items) >= self.max_size:
             return False
         
         self.items.append(item)
@@ -53,7 +55,7 @@ class Stack:
         Returns:
             Top item from the stack, or None if stack is empty
         """
-        if self.is_empty():
+        if not self.items:
             return None
         
         return self.items.pop()
@@ -65,7 +67,7 @@ class Stack:
         Returns:
             Top item from the stack, or None if stack is empty
         """
-        if self.is_empty():
+        if not self.items:
             return None
         
         return self.items[-1]
@@ -76,7 +78,11 @@ class Stack:
     
     def to_list(self) -> List[Any]:
         """Convert the stack to a Python list (top to bottom)."""
-        return self.items.copy()
+        return self.items[::-1]
+    
+    def view(self) -> Sequence[Any]:
+        """Return the items without copying (bottom to top); callers must not modify it."""
+        return self.items
     
     def display(self) -> None:
         """Display the stack contents (for debugging)."""
@@ -84,9 +90,10 @@ class Stack:
             print("Empty stack")
             return
         
-        print("Stack (top to bottom):")
-        for i in range(len(self.items) - 1, -1, -1):
-            print(f"  {self.items[i]}")
+        # One print for the whole listing instead of one per item
+        lines = ["Stack (top to bottom):"]
+        lines.extend(f"  {item}" for item in reversed(self.items))
+        print("\n".join(lines))
     
     def get_max_size(self) -> Optional[int]:
         """Get the maximum size of the stack."""
@@ -101,6 +108,6 @@ class Stack:
         """
         self.max_size = max_size
         
-        # If new max_size is smaller than current size, remove excess items
+        # If new max_size is smaller than current size, remove the oldest items in place
         if max_size is not None and len(self.items) > max_size:
-            self.items = self.items[-max_size:]
+            del self.items[:len(self.items) - max_size]
@@ -3,17 +3,44 @@ Event Search Tree Module
 Provides efficient event searching using binary search trees.
 """
 
+from __future__ import annotations
+
+import sys
 from data_structures.binary_tree import BinarySearchTree
-from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from separators import SEPARATOR_30, SEPARATOR_40, SEPARATOR_80, DIVIDER_50
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Tuple
+
+SEARCH_MENU = "\n".join([
+    "\n🔍 EVENT SEARCH TREE",
+    SEPARATOR_30,
+    "1. ➕ Add New Event",
+    "2. 📋 View All Events",
+    "3. 🔍 Search by Title",
+    "4. 📅 Search by Date",
+    "5. 🏷️  Search by Category",
+    "6. ⚡ Search by Priority",
+    "7. 📍 Search by Location",
+    "8. 📅 Upcoming Events",
+    "9. 🗑️  Delete Event",
+    "10. 📊 Tree Information",
+    "11. ↩️  Back to Main Menu",
+    SEPARATOR_30,
+])
 
 class EventNode:
     """Event node for binary search tree."""
     
     def __init__(self, event_id: str, title: str, date: str, time: str, location: str, 
                  category: str = "General", priority: str = "Medium", description: str = ""):
-        self.event_id = event_id
+        # Interned so ids loaded from JSON share one string and id lookups compare by identity;
+        # the GUI's undo path can pass a numeric id, which is kept as is
+        self.event_id = sys.intern(event_id) if isinstance(event_id, str) else event_id
         self.title = title
+        self.title_lower = title.lower()  # Computed once for case-insensitive searches
         self.date = date
         self.time = time
         self.location = location
@@ -41,7 +68,7 @@ class EventNode:
     
     def get_search_key(self) -> str:
         """Get the key used for searching (title + date)."""
-        return f"{self.title.lower()}_{self.date}"
+        return f"{self.title_lower}_{self.date}"
 
 class EventSearchTree:
     """
@@ -55,6 +82,13 @@ class EventSearchTree:
         self.categories = set()
         self.priorities = {"Low", "Medium", "High"}
         
+        # Secondary indexes kept in step with the tree, so exact-match searches
+        # don't traverse it. Each bucket maps search key -> event.
+        self.events_by_id: Dict[str, EventNode] = {}
+        self.events_by_date: Dict[str, Dict[str, EventNode]] = {}
+        self.events_by_category: Dict[str, Dict[str, EventNode]] = {}
+        self.events_by_priority: Dict[str, Dict[str, EventNode]] = {}
+        
         # Load sample events
         self.load_sample_events()
     
@@ -102,11 +136,45 @@ class EventSearchTree:
         # Use title + date as search key
         search_key = event.get_search_key()
         
+        # insert() replaces the event stored under an existing key, so drop the old one from the indexes
+        replaced = self.bst.search(search_key)
+        if replaced is not None:
+            self._unindex_event(replaced)
+        self._index_event(event)
+        
         if self.bst.insert(search_key, event):
             self.categories.add(category)
             return True
         return False
     
+    def _index_event(self, event: EventNode) -> None:
+        """Add an event to the secondary indexes."""
+        search_key = event.get_search_key()
+        self.events_by_id[event.event_id] = event
+        self.events_by_date.setdefault(event.date, {})[search_key] = event
+        self.events_by_category.setdefault(event.category.lower(), {})[search_key] = event
+        self.events_by_priority.setdefault(event.priority.lower(), {})[search_key] = event
+    
+    def _unindex_event(self, event: EventNode) -> None:
+        """Remove an event from the secondary indexes."""
+        search_key = event.get_search_key()
+        self.events_by_id.pop(event.event_id, None)
+        for index, value in ((self.events_by_date, event.date),
+                             (self.events_by_category, event.category.lower()),
+                             (self.events_by_priority, event.priority.lower())):
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(search_key, None)
+                if not bucket:
+                    del index[value]
+    
+    @staticmethod
+    def _sorted_bucket(bucket: Optional[Dict[str, EventNode]]) -> List[EventNode]:
+        """Return a bucket's events in tree (search key) order."""
+        if not bucket:
+            return []
+        return [bucket[key] for key in sorted(bucket)]
+    
     def search_by_title(self, title: str) -> List[EventNode]:
         """
         Search events by title.
@@ -117,14 +185,8 @@ class EventSearchTree:
         Returns:
             List of matching events
         """
-        results = []
-        all_events = self.bst.inorder_traversal()
-        
-        for key, event in all_events:
-            if title.lower() in event.title.lower():
-                results.append(event)
-        
-        return results
+        search_key = title.lower()
+        return [event for _, event in self.bst.inorder_iter() if search_key in event.title_lower]
     
     def search_by_date(self, date: str) -> List[EventNode]:
         """
@@ -136,14 +198,7 @@ class EventSearchTree:
         Returns:
             List of matching events
         """
-        results = []
-        all_events = self.bst.inorder_traversal()
-        
-        for key, event in all_events:
-            if event.date == date:
-                results.append(event)
-        
-        return results
+        return self._sorted_bucket(self.events_by_date.get(date))
     
     def search_by_category(self, category: str) -> List[EventNode]:
         """
@@ -155,14 +210,7 @@ class EventSearchTree:
         Returns:
             List of matching events
         """
-        results = []
-        all_events = self.bst.inorder_traversal()
-        
-        for key, event in all_events:
-            if event.category.lower() == category.lower():
-                results.append(event)
-        
-        return results
+        return self._sorted_bucket(self.events_by_category.get(category.lower()))
     
     def search_by_priority(self, priority: str) -> List[EventNode]:
         """
@@ -174,14 +222,7 @@ class EventSearchTree:
         Returns:
             List of matching events
         """
-        results = []
-        all_events = self.bst.inorder_traversal()
-        
-        for key, event in all_events:
-            if event.priority.lower() == priority.lower():
-                results.append(event)
-        
-        return results
+        return self._sorted_bucket(self.events_by_priority.get(priority.lower()))
     
     def search_by_location(self, location: str) -> List[EventNode]:
         """
@@ -194,9 +235,8 @@ class EventSearchTree:
             List of matching events
         """
         results = []
-        all_events = self.bst.inorder_traversal()
         
-        for key, event in all_events:
+        for key, event in self.bst:
             if location.lower() in event.location.lower():
                 results.append(event)
         
@@ -204,8 +244,7 @@ class EventSearchTree:
     
     def get_all_events(self) -> List[EventNode]:
         """Get all events in sorted order."""
-        all_events = self.bst.inorder_traversal()
-        return [event for key, event in all_events]
+        return [event for key, event in self.bst]
     
     def get_event_count(self) -> int:
         """Get the total number of events."""
@@ -229,13 +268,12 @@ class EventSearchTree:
         Returns:
             True if deletion successful
         """
-        all_events = self.bst.inorder_traversal()
+        event = self.events_by_id.get(event_id)
+        if event is None:
+            return False
         
-        for key, event in all_events:
-            if event.event_id == event_id:
-                return self.bst.delete(key)
-        
-        return False
+        self._unindex_event(event)
+        return self.bst.delete(event.get_search_key())
     
     def get_events_by_date_range(self, start_date: str, end_date: str) -> List[EventNode]:
         """
@@ -249,9 +287,8 @@ class EventSearchTree:
             List of events in date range
         """
         results = []
-        all_events = self.bst.inorder_traversal()
         
-        for key, event in all_events:
+        for key, event in self.bst:
             if start_date <= event.date <= end_date:
                 results.append(event)
         
@@ -281,83 +318,76 @@ class EventSearchTree:
             print(f"\n📅 No {title.lower()} found.")
             return
         
-        print(f"\n📅 {title} ({len(events)} total)")
-        print("=" * 80)
+        lines = [f"\n📅 {title} ({len(events)} total)", SEPARATOR_80]
         
         for i, event in enumerate(events, 1):
-            print(f"{i}. {event.title}")
-            print(f"   📅 Date: {event.date}")
-            print(f"   ⏰ Time: {event.time}")
-            print(f"   📍 Location: {event.location}")
-            print(f"   🏷️  Category: {event.category}")
-            print(f"   ⚡ Priority: {event.priority}")
-            print(f"   🆔 ID: {event.event_id}")
+            lines.append(f"{i}. {event.title}")
+            lines.append(f"   📅 Date: {event.date}")
+            lines.append(f"   ⏰ Time: {event.time}")
+            lines.append(f"   📍 Location: {event.location}")
+            lines.append(f"   🏷️  Category: {event.category}")
+            lines.append(f"   ⚡ Priority: {event.priority}")
+            lines.append(f"   🆔 ID: {event.event_id}")
             if event.description:
-                print(f"   📝 Description: {event.description}")
-            print("-" * 50)
+                lines.append(f"   📝 Description: {event.description}")
+            lines.append(DIVIDER_50)
+        
+        print("\n".join(lines))
     
     def display_tree_info(self):
         """Display information about the search tree."""
         print("\n🌳 EVENT SEARCH TREE INFO")
-        print("=" * 40)
+        print(SEPARATOR_40)
         print(f"📊 Total Events: {self.get_event_count()}")
         print(f"🌲 Tree Height: {self.bst.get_height()}")
         print(f"⚖️  Balanced: {'Yes' if self.bst.is_balanced() else 'No'}")
         print(f"🏷️  Categories: {', '.join(self.get_categories())}")
         print(f"⚡ Priorities: {', '.join(self.get_priorities())}")
-        print("=" * 40)
+        print(SEPARATOR_40)
     
     def run_search_menu(self):
         """Run the event search tree menu."""
+        actions = {
+            "1": self.add_event_menu,
+            "2": self.view_all_events_menu,
+            "3": self.search_by_title_menu,
+            "4": self.search_by_date_menu,
+            "5": self.search_by_category_menu,
+            "6": self.search_by_priority_menu,
+            "7": self.search_by_location_menu,
+            "8": self.upcoming_events_menu,
+            "9": self.delete_event_menu,
+            "10": self.tree_info_menu,
+        }
+        
         while True:
-            print("\n🔍 EVENT SEARCH TREE")
-            print("=" * 30)
-            print("1. ➕ Add New Event")
-            print("2. 📋 View All Events")
-            print("3. 🔍 Search by Title")
-            print("4. 📅 Search by Date")
-            print("5. 🏷️  Search by Category")
-            print("6. ⚡ Search by Priority")
-            print("7. 📍 Search by Location")
-            print("8. 📅 Upcoming Events")
-            print("9. 🗑️  Delete Event")
-            print("10. 📊 Tree Information")
-            print("11. ↩️  Back to Main Menu")
-            print("=" * 30)
+            print(SEARCH_MENU)
             
             choice = input("Enter your choice: ").strip()
             
-            if choice == "1":
-                self.add_event_menu()
-            elif choice == "2":
-                self.display_events(self.get_all_events(), "ALL EVENTS")
-                input("Press Enter to continue...")
-            elif choice == "3":
-                self.search_by_title_menu()
-            elif choice == "4":
-                self.search_by_date_menu()
-            elif choice == "5":
-                self.search_by_category_menu()
-            elif choice == "6":
-                self.search_by_priority_menu()
-            elif choice == "7":
-                self.search_by_location_menu()
-            elif choice == "8":
-                self.upcoming_events_menu()
-            elif choice == "9":
-                self.delete_event_menu()
-            elif choice == "10":
-                self.display_tree_info()
-                input("Press Enter to continue...")
-            elif choice == "11":
+            if choice == "11":
                 break
-            else:
+            
+            action = actions.get(choice)
+            if action is None:
                 print("❌ Invalid choice. Please try again.")
+            else:
+                action()
+    
+    def view_all_events_menu(self):
+        """Menu for viewing all events."""
+        self.display_events(self.get_all_events(), "ALL EVENTS")
+        input("Press Enter to continue...")
+    
+    def tree_info_menu(self):
+        """Menu for viewing search tree information."""
+        self.display_tree_info()
+        input("Press Enter to continue...")
     
     def add_event_menu(self):
         """Menu for adding a new event."""
         print("\n➕ ADD NEW EVENT")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         title = input("Event Title: ").strip()
         if not title:
@@ -419,7 +449,7 @@ class EventSearchTree:
     def search_by_title_menu(self):
         """Menu for searching by title."""
         print("\n🔍 SEARCH BY TITLE")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         title = input("Enter title keyword: ").strip()
         if not title:
@@ -434,7 +464,7 @@ class EventSearchTree:
     def search_by_date_menu(self):
         """Menu for searching by date."""
         print("\n📅 SEARCH BY DATE")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         date = input("Enter date (YYYY-MM-DD): ").strip()
         if not date:
@@ -449,7 +479,7 @@ class EventSearchTree:
     def search_by_category_menu(self):
         """Menu for searching by category."""
         print("\n🏷️  SEARCH BY CATEGORY")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         categories = self.get_categories()
         print("Available categories:")
@@ -472,7 +502,7 @@ class EventSearchTree:
     def search_by_priority_menu(self):
         """Menu for searching by priority."""
         print("\n⚡ SEARCH BY PRIORITY")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         priorities = self.get_priorities()
         print("Available priorities:")
@@ -495,7 +525,7 @@ class EventSearchTree:
     def search_by_location_menu(self):
         """Menu for searching by location."""
         print("\n📍 SEARCH BY LOCATION")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         location = input("Enter location keyword: ").strip()
         if not location:
@@ -510,7 +540,7 @@ class EventSearchTree:
     def upcoming_events_menu(self):
         """Menu for viewing upcoming events."""
         print("\n📅 UPCOMING EVENTS")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         try:
             days = int(input("Enter number of days to look ahead (default 7): ") or "7")
@@ -532,7 +562,7 @@ class EventSearchTree:
             return
         
         print("\n🗑️  DELETE EVENT")
-        print("=" * 30)
+        print(SEPARATOR_30)
         self.display_events(events, "ALL EVENTS")
         
         try:
@@ -3,12 +3,32 @@ Events Manager Module
 Provides event management using doubly linked lists and undo/redo with stacks.
 """
 
+from __future__ import annotations
+
 from data_structures.linked_list import DoublyLinkedList
 from data_structures.stack import Stack
-from typing import Dict, List, Optional
 from datetime import datetime
 import json
 import os
+from separators import SEPARATOR_30, SEPARATOR_40, SEPARATOR_50, SEPARATOR_60, DIVIDER_40
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional
+
+EVENTS_MENU = "\n".join([
+    "\n📅 EVENTS MANAGER",
+    SEPARATOR_30,
+    "1. ➕ Add New Event",
+    "2. 📋 View All Events",
+    "3. 🔍 Search Events",
+    "4. ✏️  Edit Event",
+    "5. 🗑️  Delete Event",
+    "6. ↩️  Undo",
+    "7. ↪️  Redo",
+    "8. ↩️  Back to Main Menu",
+    SEPARATOR_30,
+])
 
 class Event:
     """Event class to store event information."""
@@ -281,59 +301,54 @@ class EventsManager:
             print("\n📅 No events found.")
             return
         
-        print(f"\n📅 EVENTS ({len(events)} total)")
-        print("=" * 60)
+        lines = [f"\n📅 EVENTS ({len(events)} total)", SEPARATOR_60]
         
         for i, event in enumerate(events):
-            print(f"{i+1}. {event.title}")
-            print(f"   📅 Date: {event.date}")
-            print(f"   ⏰ Time: {event.time}")
-            print(f"   📍 Location: {event.location}")
+            lines.append(f"{i+1}. {event.title}")
+            lines.append(f"   📅 Date: {event.date}")
+            lines.append(f"   ⏰ Time: {event.time}")
+            lines.append(f"   📍 Location: {event.location}")
             if event.description:
-                print(f"   📝 Description: {event.description}")
-            print("-" * 40)
+                lines.append(f"   📝 Description: {event.description}")
+            lines.append(DIVIDER_40)
+        
+        print("\n".join(lines))
     
     def run_events_menu(self):
         """Run the events manager menu."""
+        actions = {
+            "1": self.add_event_menu,
+            "2": self.view_events_menu,
+            "3": self.search_events_menu,
+            "4": self.edit_event_menu,
+            "5": self.delete_event_menu,
+            "6": self.undo_action,
+            "7": self.redo_action,
+        }
+        
         while True:
-            print("\n📅 EVENTS MANAGER")
-            print("=" * 30)
-            print("1. ➕ Add New Event")
-            print("2. 📋 View All Events")
-            print("3. 🔍 Search Events")
-            print("4. ✏️  Edit Event")
-            print("5. 🗑️  Delete Event")
-            print("6. ↩️  Undo")
-            print("7. ↪️  Redo")
-            print("8. ↩️  Back to Main Menu")
-            print("=" * 30)
+            print(EVENTS_MENU)
             
             choice = input("Enter your choice: ").strip()
             
-            if choice == "1":
-                self.add_event_menu()
-            elif choice == "2":
-                self.display_events()
-                input("Press Enter to continue...")
-            elif choice == "3":
-                self.search_events_menu()
-            elif choice == "4":
-                self.edit_event_menu()
-            elif choice == "5":
-                self.delete_event_menu()
-            elif choice == "6":
-                self.undo_action()
-            elif choice == "7":
-                self.redo_action()
-            elif choice == "8":
+            if choice == "8":
                 break
-            else:
+            
+            action = actions.get(choice)
+            if action is None:
                 print("❌ Invalid choice. Please try again.")
+            else:
+                action()
+    
+    def view_events_menu(self):
+        """Menu for viewing all events."""
+        self.display_events()
+        input("Press Enter to continue...")
     
     def add_event_menu(self):
         """Menu for adding a new event."""
         print("\n➕ ADD NEW EVENT")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         title = input("Event Title: ").strip()
         if not title:
@@ -363,7 +378,7 @@ class EventsManager:
     def search_events_menu(self):
         """Menu for searching events."""
         print("\n🔍 SEARCH EVENTS")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         keyword = input("Enter search keyword: ").strip()
         if not keyword:
@@ -377,7 +392,7 @@ class EventsManager:
             print(f"❌ No events found matching '{keyword}'.")
         else:
             print(f"\n🔍 SEARCH RESULTS ({len(results)} found)")
-            print("=" * 50)
+            print(SEPARATOR_50)
             for i, event in enumerate(results, 1):
                 print(f"{i}. {event}")
         
@@ -392,7 +407,7 @@ class EventsManager:
             return
         
         print("\n✏️  EDIT EVENT")
-        print("=" * 30)
+        print(SEPARATOR_30)
         self.display_events()
         
         try:
@@ -414,7 +429,7 @@ class EventsManager:
             return
         
         print(f"\n✏️  EDITING: {event.title}")
-        print("=" * 40)
+        print(SEPARATOR_40)
         print("Leave blank to keep current value.")
         
         title = input(f"Title [{event.title}]: ").strip() or event.title
@@ -439,7 +454,7 @@ class EventsManager:
             return
         
         print("\n🗑️  DELETE EVENT")
-        print("=" * 30)
+        print(SEPARATOR_30)
         self.display_events()
         
         try:
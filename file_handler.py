@@ -8,6 +8,29 @@ import os
 from typing import List, Dict, Any
 from datetime import datetime, date, time
 
+# orjson is optional; it encodes and parses JSON several times faster than the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def write_json(file_path: str, data: Dict[str, Any]) -> None:
+    """Write data to a JSON file, indented by two spaces."""
+    if orjson is not None:
+        with open(file_path, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2, ensure_ascii=False)
+
+def read_json(file_path: str) -> Dict[str, Any]:
+    """Read a JSON file."""
+    if orjson is not None:
+        with open(file_path, 'rb') as file:
+            return orjson.loads(file.read())
+    with open(file_path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
 class FileHandler:
     """Handles file operations for events and tasks data."""
     
@@ -51,8 +74,7 @@ class FileHandler:
                 "last_updated": datetime.now().isoformat()
             }
             
-            with open(self.events_file, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            write_json(self.events_file, data)
             
             return True
         except Exception as e:
@@ -70,10 +92,9 @@ class FileHandler:
             if not os.path.exists(self.events_file):
                 return []
             
-            with open(self.events_file, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                events = data.get("events", [])
-                return events
+            data = read_json(self.events_file)
+            events = data.get("events", [])
+            return events
         except Exception as e:
             print(f"❌ Error loading events: {e}")
             return []
@@ -102,8 +123,7 @@ class FileHandler:
                 "last_updated": datetime.now().isoformat()
             }
             
-            with open(self.tasks_file, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            write_json(self.tasks_file, data)
             
             return True
         except Exception as e:
@@ -121,10 +141,9 @@ class FileHandler:
             if not os.path.exists(self.tasks_file):
                 return []
             
-            with open(self.tasks_file, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                tasks = data.get("tasks", [])
-                return tasks
+            data = read_json(self.tasks_file)
+            tasks = data.get("tasks", [])
+            return tasks
         except Exception as e:
             print(f"❌ Error loading tasks: {e}")
             return []
@@ -146,8 +165,7 @@ class FileHandler:
             }
             
             tree_file = os.path.join(self.data_dir, "event_tree.json")
-            with open(tree_file, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            write_json(tree_file, data)
             
             return True
         except Exception as e:
@@ -166,9 +184,8 @@ class FileHandler:
             if not os.path.exists(tree_file):
                 return []
             
-            with open(tree_file, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                return data.get("event_tree_data", [])
+            data = read_json(tree_file)
+            return data.get("event_tree_data", [])
         except Exception as e:
             print(f"❌ Error loading event tree data: {e}")
             return []
@@ -3,10 +3,27 @@ Campus Navigator Module
 Provides graph-based campus navigation using BFS, DFS, and Dijkstra's algorithms.
 """
 
-import json
+from __future__ import annotations
+
 import os
 from data_structures.graph import Graph
-from typing import List, Tuple, Dict, Optional
+from file_handler import read_json
+from separators import SEPARATOR_30, SEPARATOR_40, SEPARATOR_50, SEPARATOR_60
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List, Tuple, Dict, Optional
+
+NAVIGATION_MENU = "\n".join([
+    "\n🗺️  CAMPUS NAVIGATOR",
+    SEPARATOR_30,
+    "1. 🗺️  View Campus Map",
+    "2. 🧭 Navigate to Building",
+    "3. 🔍 Explore Campus (DFS)",
+    "4. 📊 Campus Information",
+    "5. ↩️  Back to Main Menu",
+    SEPARATOR_30,
+])
 
 class CampusNavigator:
     """
@@ -19,18 +36,21 @@ class CampusNavigator:
         self.graph = Graph()
         self.buildings = {}
         self.current_location = None
+        # Routes found so far, keyed by (start, destination); the graph only changes on load
+        self.route_cache: Dict[Tuple[str, str], List[Tuple[List[str], float]]] = {}
         self.load_campus_data()
     
     def load_campus_data(self):
         """Load campus buildings and routes data from JSON file."""
+        self.route_cache.clear()
         try:
             # Try to load from JSON file
             json_path = os.path.join("data", "campus_data.json")
             if os.path.exists(json_path):
-                with open(json_path, 'r') as file:
-                    data = json.load(file)
-                    self.buildings = data.get("buildings", {})
-                    routes = data.get("routes", [])
+                # Parsed with orjson when it is installed
+                data = read_json(json_path)
+                self.buildings = data.get("buildings", {})
+                routes = data.get("routes", [])
             else:
                 print("⚠️  campus_data.json not found. Using default data.")
                 self.load_default_data()
@@ -40,12 +60,10 @@ class CampusNavigator:
             for building in self.buildings.keys():
                 self.graph.add_vertex(building)
             
-            # Add routes with distances
-            for route in routes:
-                from_building = route["from"]
-                to_building = route["to"]
-                distance = route["distance"]
-                self.graph.add_edge(from_building, to_building, distance)
+            # Add routes with distances; routes listed twice are only added once
+            self.graph.add_edges_from(
+                (route["from"], route["to"], route["distance"]) for route in routes
+            )
                 
         except Exception as e:
             print(f"❌ Error loading campus data: {e}")
@@ -91,7 +109,26 @@ class CampusNavigator:
         if not self.current_location:
             return [], 0.0
         
-        return self.graph.dijkstra(self.current_location, destination)
+        # Point-to-point query, so search from both ends
+        return self.graph.dijkstra_bidirectional(self.current_location, destination)
+    
+    def find_routes(self, start: str, destination: str) -> List[Tuple[List[str], float]]:
+        """
+        Find possible routes between two buildings, reusing earlier results.
+        
+        Args:
+            start: Starting building
+            destination: Target building
+            
+        Returns:
+            List of (path, distance) tuples sorted by distance
+        """
+        key = (start, destination)
+        routes = self.route_cache.get(key)
+        if routes is None:
+            routes = self.graph.find_all_paths(start, destination)
+            self.route_cache[key] = routes
+        return routes
     
     def get_reachable_buildings(self) -> List[str]:
         """
@@ -124,7 +161,7 @@ class CampusNavigator:
     def display_campus_map(self):
         """Display a simple text-based campus map."""
         print("\n🗺️  UET CAMPUS MAP")
-        print("=" * 40)
+        print(SEPARATOR_40)
         
         if not self.current_location:
             print("⚠️  No current location set.")
@@ -141,7 +178,7 @@ class CampusNavigator:
                     distance = self.graph.dijkstra(self.current_location, building)[1]
                     print(f"  • {building} ({distance:.0f}m)")
         
-        print("=" * 40)
+        print(SEPARATOR_40)
     
     def navigate_to_building(self, destination: str):
         """
@@ -159,7 +196,7 @@ class CampusNavigator:
             return
         
         # Find all possible paths
-        all_paths = self.graph.find_all_paths(self.current_location, destination)
+        all_paths = self.find_routes(self.current_location, destination)
         
         if not all_paths:
             print(f"❌ No path found to {destination}.")
@@ -169,11 +206,11 @@ class CampusNavigator:
         shortest_path, shortest_distance = all_paths[0]
         
         print(f"\n🗺️  NAVIGATION TO {destination.upper()}")
-        print("=" * 60)
+        print(SEPARATOR_60)
         print(f"📍 From: {self.current_location}")
         print(f"🎯 To: {destination}")
         print(f"🔍 Found {len(all_paths)} possible route(s)")
-        print("=" * 60)
+        print(SEPARATOR_60)
         
         # Display all paths
         for i, (path, distance) in enumerate(all_paths, 1):
@@ -184,42 +221,42 @@ class CampusNavigator:
             if i == 1:
                 print(f"   ⭐ SHORTEST PATH (Dijkstra's Algorithm)")
         
-        print("\n" + "=" * 60)
+        print("\n" + SEPARATOR_60)
         print(f"💡 RECOMMENDATION: Take Route 1 ({shortest_distance:.0f}m)")
-        print("=" * 60)
+        print(SEPARATOR_60)
     
     def run_navigation_menu(self):
         """Run the navigation module menu."""
+        actions = {
+            "1": self.view_campus_map_menu,
+            "2": self.navigate_menu,
+            "3": self.explore_campus_menu,
+            "4": self.show_campus_info,
+        }
+        
         while True:
-            print("\n🗺️  CAMPUS NAVIGATOR")
-            print("=" * 30)
-            print("1. 🗺️  View Campus Map")
-            print("2. 🧭 Navigate to Building")
-            print("3. 🔍 Explore Campus (DFS)")
-            print("4. 📊 Campus Information")
-            print("5. ↩️  Back to Main Menu")
-            print("=" * 30)
+            print(NAVIGATION_MENU)
             
             choice = input("Enter your choice: ").strip()
             
-            if choice == "1":
-                self.display_campus_map()
-                input("Press Enter to continue...")
-            elif choice == "2":
-                self.navigate_menu()
-            elif choice == "3":
-                self.explore_campus_menu()
-            elif choice == "4":
-                self.show_campus_info()
-            elif choice == "5":
+            if choice == "5":
                 break
-            else:
+            
+            action = actions.get(choice)
+            if action is None:
                 print("❌ Invalid choice. Please try again.")
+            else:
+                action()
+    
+    def view_campus_map_menu(self):
+        """Menu for viewing the campus map."""
+        self.display_campus_map()
+        input("Press Enter to continue...")
     
     def navigate_menu(self):
         """Menu for navigation."""
         print(f"\n🧭 NAVIGATE TO BUILDING")
-        print("=" * 40)
+        print(SEPARATOR_40)
         
         buildings = self.get_all_buildings()
         
@@ -270,7 +307,7 @@ class CampusNavigator:
     def explore_campus_menu(self):
         """Menu for campus exploration."""
         print(f"\n🔍 EXPLORE CAMPUS")
-        print("=" * 50)
+        print(SEPARATOR_50)
         
         buildings = self.get_all_buildings()
         
@@ -298,7 +335,7 @@ class CampusNavigator:
             print(f"📍 Starting location: {self.current_location}")
         
         print(f"\n🔍 EXPLORING CAMPUS FROM {self.current_location.upper()}")
-        print("=" * 50)
+        print(SEPARATOR_50)
         
         path = self.explore_campus_dfs()
         print("DFS Exploration Path:")
@@ -311,7 +348,7 @@ class CampusNavigator:
     def show_campus_info(self):
         """Show campus graph information."""
         print("\n📊 CAMPUS INFORMATION")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         info = self.get_campus_info()
         print(f"🏢 Total Buildings: {info['vertices']}")
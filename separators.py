@@ -0,0 +1,12 @@
+"""
+Separators Module
+Horizontal rules used by the console menus and listings of every module.
+"""
+
+SEPARATOR_30 = "=" * 30
+SEPARATOR_40 = "=" * 40
+SEPARATOR_50 = "=" * 50
+SEPARATOR_60 = "=" * 60
+SEPARATOR_80 = "=" * 80
+DIVIDER_40 = "-" * 40
+DIVIDER_50 = "-" * 50
@@ -3,9 +3,29 @@ Task Scheduler Module
 Provides queue-based task scheduling with FIFO management.
 """
 
+from __future__ import annotations
+
 from data_structures.queue import Queue
-from typing import Dict, List, Optional
 from datetime import datetime
+from separators import SEPARATOR_30, SEPARATOR_40, SEPARATOR_60, DIVIDER_40
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional
+
+TASK_MENU = "\n".join([
+    "\n✅ TASK SCHEDULER",
+    SEPARATOR_30,
+    "1. ➕ Add New Task",
+    "2. ✅ Complete Next Task",
+    "3. 👀 View Next Task",
+    "4. 📋 View Pending Tasks",
+    "5. ✅ View Completed Tasks",
+    "6. 📊 View Statistics",
+    "7. 🗑️  Clear Completed Tasks",
+    "8. ↩️  Back to Main Menu",
+    SEPARATOR_30,
+])
 
 class Task:
     """Task class to store task information."""
@@ -152,17 +172,18 @@ class TaskScheduler:
             print("\n✅ No pending tasks!")
             return
         
-        print(f"\n⏳ PENDING TASKS ({len(tasks)} total)")
-        print("=" * 60)
+        lines = [f"\n⏳ PENDING TASKS ({len(tasks)} total)", SEPARATOR_60]
         
         for i, task in enumerate(tasks, 1):
-            print(f"{i}. {task.title}")
-            print(f"   📝 Description: {task.description}")
-            print(f"   ⚡ Priority: {task.priority}")
+            lines.append(f"{i}. {task.title}")
+            lines.append(f"   📝 Description: {task.description}")
+            lines.append(f"   ⚡ Priority: {task.priority}")
             if task.deadline:
-                print(f"   📅 Deadline: {task.deadline}")
-            print(f"   📅 Created: {task.created_at.strftime('%Y-%m-%d %H:%M')}")
-            print("-" * 40)
+                lines.append(f"   📅 Deadline: {task.deadline}")
+            lines.append(f"   📅 Created: {task.created_at.strftime('%Y-%m-%d %H:%M')}")
+            lines.append(DIVIDER_40)
+        
+        print("\n".join(lines))
     
     def display_completed_tasks(self):
         """Display all completed tasks."""
@@ -172,24 +193,25 @@ class TaskScheduler:
             print("\n📊 No completed tasks yet.")
             return
         
-        print(f"\n✅ COMPLETED TASKS ({len(tasks)} total)")
-        print("=" * 60)
+        lines = [f"\n✅ COMPLETED TASKS ({len(tasks)} total)", SEPARATOR_60]
         
         for i, task in enumerate(tasks, 1):
-            print(f"{i}. {task.title}")
-            print(f"   📝 Description: {task.description}")
-            print(f"   ⚡ Priority: {task.priority}")
+            lines.append(f"{i}. {task.title}")
+            lines.append(f"   📝 Description: {task.description}")
+            lines.append(f"   ⚡ Priority: {task.priority}")
             if task.deadline:
-                print(f"   📅 Deadline: {task.deadline}")
-            print(f"   ✅ Completed: {task.completed_at.strftime('%Y-%m-%d %H:%M')}")
-            print("-" * 40)
+                lines.append(f"   📅 Deadline: {task.deadline}")
+            lines.append(f"   ✅ Completed: {task.completed_at.strftime('%Y-%m-%d %H:%M')}")
+            lines.append(DIVIDER_40)
+        
+        print("\n".join(lines))
     
     def display_statistics(self):
         """Display task statistics."""
         stats = self.get_task_statistics()
         
         print("\n📊 TASK STATISTICS")
-        print("=" * 30)
+        print(SEPARATOR_30)
         print(f"⏳ Pending Tasks: {stats['pending']}")
         print(f"✅ Completed Tasks: {stats['completed']}")
         print(f"📈 Total Created: {stats['total_created']}")
@@ -200,51 +222,53 @@ class TaskScheduler:
             if next_task:
                 print(f"\n🎯 Next Task: {next_task.title}")
         
-        print("=" * 30)
+        print(SEPARATOR_30)
     
     def run_task_menu(self):
         """Run the task scheduler menu."""
+        actions = {
+            "1": self.add_task_menu,
+            "2": self.complete_task_menu,
+            "3": self.view_next_task,
+            "4": self.view_pending_tasks_menu,
+            "5": self.view_completed_tasks_menu,
+            "6": self.view_statistics_menu,
+            "7": self.clear_completed_menu,
+        }
+        
         while True:
-            print("\n✅ TASK SCHEDULER")
-            print("=" * 30)
-            print("1. ➕ Add New Task")
-            print("2. ✅ Complete Next Task")
-            print("3. 👀 View Next Task")
-            print("4. 📋 View Pending Tasks")
-            print("5. ✅ View Completed Tasks")
-            print("6. 📊 View Statistics")
-            print("7. 🗑️  Clear Completed Tasks")
-            print("8. ↩️  Back to Main Menu")
-            print("=" * 30)
+            print(TASK_MENU)
             
             choice = input("Enter your choice: ").strip()
             
-            if choice == "1":
-                self.add_task_menu()
-            elif choice == "2":
-                self.complete_task_menu()
-            elif choice == "3":
-                self.view_next_task()
-            elif choice == "4":
-                self.display_pending_tasks()
-                input("Press Enter to continue...")
-            elif choice == "5":
-                self.display_completed_tasks()
-                input("Press Enter to continue...")
-            elif choice == "6":
-                self.display_statistics()
-                input("Press Enter to continue...")
-            elif choice == "7":
-                self.clear_completed_menu()
-            elif choice == "8":
+            if choice == "8":
                 break
-            else:
+            
+            action = actions.get(choice)
+            if action is None:
                 print("❌ Invalid choice. Please try again.")
+            else:
+                action()
+    
+    def view_pending_tasks_menu(self):
+        """Menu for viewing pending tasks."""
+        self.display_pending_tasks()
+        input("Press Enter to continue...")
+    
+    def view_completed_tasks_menu(self):
+        """Menu for viewing completed tasks."""
+        self.display_completed_tasks()
+        input("Press Enter to continue...")
+    
+    def view_statistics_menu(self):
+        """Menu for viewing task statistics."""
+        self.display_statistics()
+        input("Press Enter to continue...")
     
     def add_task_menu(self):
         """Menu for adding a new task."""
         print("\n➕ ADD NEW TASK")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         title = input("Task Title: ").strip()
         if not title:
@@ -292,7 +316,7 @@ class TaskScheduler:
         
         next_task = self.peek_next_task()
         print(f"\n✅ COMPLETE NEXT TASK")
-        print("=" * 40)
+        print(SEPARATOR_40)
         print(f"Next task: {next_task.title}")
         print(f"Description: {next_task.description}")
         print(f"Priority: {next_task.priority}")
@@ -320,14 +344,14 @@ class TaskScheduler:
         
         next_task = self.peek_next_task()
         print(f"\n👀 NEXT TASK")
-        print("=" * 30)
+        print(SEPARATOR_30)
         print(f"Title: {next_task.title}")
         print(f"Description: {next_task.description}")
         print(f"Priority: {next_task.priority}")
         if next_task.deadline:
             print(f"Deadline: {next_task.deadline}")
         print(f"Created: {next_task.created_at.strftime('%Y-%m-%d %H:%M')}")
-        print("=" * 30)
+        print(SEPARATOR_30)
         
         input("Press Enter to continue...")
     
@@ -339,7 +363,7 @@ class TaskScheduler:
             return
         
         print(f"\n🗑️  CLEAR COMPLETED TASKS")
-        print("=" * 40)
+        print(SEPARATOR_40)
         print(f"You have {len(self.completed_tasks)} completed tasks.")
         
         confirm = input("Are you sure you want to clear all completed tasks? (y/N): ").strip().lower()
@@ -0,0 +1,89 @@
+import random
+import unittest
+
+from data_structures.binary_tree import BinarySearchTree
+
+
+def check_subtree(test, node, low=None, high=None):
+    """Verify keys are ordered, stored heights are right and AVL balance holds; return the height."""
+    if node is None:
+        return -1
+    if low is not None:
+        test.assertLess(low, node.key)
+    if high is not None:
+        test.assertLess(node.key, high)
+    left = check_subtree(test, node.left, low, node.key)
+    right = check_subtree(test, node.right, node.key, high)
+    test.assertLessEqual(abs(left - right), 1, f"unbalanced at {node.key!r}")
+    test.assertEqual(node.height, max(left, right) + 1, f"stale height at {node.key!r}")
+    return node.height
+
+
+class AvlTreeTests(unittest.TestCase):
+    """The tree must stay a balanced search tree through any mix of inserts and deletes."""
+
+    def check_tree(self, tree, model):
+        height = check_subtree(self, tree.root)
+        self.assertEqual(tree.get_height(), height)
+        self.assertEqual(tree.inorder_traversal(), sorted(model.items()))
+        self.assertEqual(tree.get_size(), len(model))
+        self.assertEqual(len(tree), len(model))
+
+    def test_random_inserts_and_deletes(self):
+        for seed in range(100):
+            rng = random.Random(seed)
+            tree = BinarySearchTree()
+            model = {}
+            for _ in range(200):
+                key = rng.randrange(60)
+                if rng.random() < 0.6:
+                    self.assertEqual(tree.insert(key, str(key)), key not in model)
+                    model[key] = str(key)
+                else:
+                    self.assertEqual(tree.delete(key), key in model)
+                    model.pop(key, None)
+                self.check_tree(tree, model)
+            for key in range(61):
+                self.assertEqual(tree.search(key), model.get(key))
+                self.assertEqual(key in tree, key in model)
+
+    def test_sorted_inserts_stay_logarithmic(self):
+        tree = BinarySearchTree()
+        for key in range(1000):
+            tree.insert(key)
+        self.check_tree(tree, dict.fromkeys(range(1000)))
+        # An AVL tree with n nodes is at most about 1.44 * log2(n) high
+        self.assertLessEqual(tree.get_height(), 14)
+        for key in range(0, 1000, 2):
+            tree.delete(key)
+        self.check_tree(tree, dict.fromkeys(range(1, 1000, 2)))
+
+    def test_bulk_insert(self):
+        rng = random.Random(7)
+        items = [(rng.randrange(100), value) for value in range(300)]
+        tree = BinarySearchTree()
+        model = dict(items)  # Later duplicates win, as with insert()
+        self.assertEqual(tree.bulk_insert(items), len(model))
+        self.check_tree(tree, model)
+        # Existing keys are not new, but their values are still replaced
+        self.assertEqual(tree.bulk_insert(items[:10]), 0)
+        model.update(items[:10])
+        self.check_tree(tree, model)
+
+    def test_string_keys(self):
+        rng = random.Random(3)
+        tree = BinarySearchTree()
+        model = {}
+        for _ in range(300):
+            key = f"event {rng.randrange(80)}_2024-01-{rng.randrange(1, 29):02d}"
+            if rng.random() < 0.7:
+                tree.insert(key, key.upper())
+                model[key] = key.upper()
+            else:
+                tree.delete(key)
+                model.pop(key, None)
+        self.check_tree(tree, model)
+
+
+if __name__ == '__main__':
+    unittest.main()
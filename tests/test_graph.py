@@ -0,0 +1,178 @@
+import random
+import unittest
+from collections import deque
+
+from data_structures.graph import Graph
+
+
+def random_graph(seed, max_vertices=10, max_edges=25, weights=(0, 1, 1.5, 2, 3, 7)):
+    """Small random undirected graph; vertex names are the strings '0', '1', ..."""
+    rng = random.Random(seed)
+    graph = Graph()
+    vertices = rng.randint(1, max_vertices)
+    for vertex in range(vertices):
+        graph.add_vertex(str(vertex))
+    for _ in range(rng.randint(0, max_edges)):
+        graph.add_edge(str(rng.randrange(vertices)), str(rng.randrange(vertices)), rng.choice(weights))
+    return graph
+
+
+def path_length(graph, path):
+    """Total weight of a path, taking the lightest edge between each pair."""
+    return sum(min(weight for neighbor, weight in graph.get_neighbors(a) if neighbor == b)
+               for a, b in zip(path, path[1:]))
+
+
+def reference_all_paths(graph, start, end, max_paths=10):
+    """find_all_paths as originally written: each queue entry carries a copy of its path."""
+    if start not in graph.get_vertices() or end not in graph.get_vertices():
+        return []
+    if start == end:
+        return [([start], 0.0)]
+    paths = []
+    queue = deque([(start, [start], 0.0)])
+    while queue and len(paths) < max_paths:
+        current, path, distance = queue.popleft()
+        if current == end:
+            paths.append((path, distance))
+            continue
+        for neighbor, weight in graph.get_neighbors(current):
+            if neighbor not in path:
+                queue.append((neighbor, path + [neighbor], distance + weight))
+    paths.sort(key=lambda item: item[1])
+    return paths
+
+
+class AddEdgeTests(unittest.TestCase):
+    """Edge insertion: idempotence, weight updates and bulk loading."""
+
+    def test_readding_edge_does_not_duplicate_it(self):
+        graph = Graph()
+        self.assertTrue(graph.add_edge('A', 'B', 2))
+        self.assertFalse(graph.add_edge('B', 'A', 2))
+        self.assertEqual(graph.get_neighbors('A'), [('B', 2)])
+        self.assertEqual(graph.get_neighbors('B'), [('A', 2)])
+        self.assertEqual(graph.get_graph_info()['edges'], 1)
+
+    def test_readding_edge_with_new_weight_updates_it(self):
+        graph = Graph()
+        graph.add_edge('A', 'B', 2)
+        graph.add_edge('A', 'C', 1)
+        self.assertFalse(graph.add_edge('B', 'A', 5))
+        self.assertEqual(graph.get_neighbors('A'), [('B', 5), ('C', 1)])
+        self.assertEqual(graph.get_neighbors('B'), [('A', 5)])
+        self.assertEqual(graph.get_graph_info()['edges'], 2)
+        self.assertEqual(graph.dijkstra('A', 'B'), (['A', 'B'], 5))
+
+    def test_directed_edge_only_goes_one_way(self):
+        graph = Graph()
+        graph.add_edge('A', 'B', 1, directed=True)
+        self.assertEqual(graph.get_neighbors('B'), [])
+        self.assertEqual(graph.bfs('B'), ['B'])
+        self.assertEqual(graph.dijkstra('B', 'A'), ([], float('inf')))
+
+    def test_add_edges_from_directed_sink(self):
+        graph = Graph()
+        self.assertEqual(graph.add_edges_from([('A', 'B', 1)], directed=True), 1)
+        self.assertEqual(graph.get_vertices(), {'A', 'B'})
+        self.assertEqual(graph.bfs('A'), ['A', 'B'])
+        self.assertEqual(graph.dfs('A'), ['A', 'B'])
+        self.assertEqual(graph.dijkstra('A', 'B'), (['A', 'B'], 1))
+        self.assertEqual(graph.find_all_paths('A', 'B'), [(['A', 'B'], 1.0)])
+
+    def test_add_edges_from_matches_add_edge(self):
+        edges = [('A', 'B', 3), ('B', 'C', 1), ('A', 'B', 3), ('C', 'A', 4), ('C', 'D', 2)]
+        bulk = Graph()
+        self.assertEqual(bulk.add_edges_from(iter(edges)), 4)
+        single = Graph()
+        for edge in edges:
+            single.add_edge(*edge)
+        for vertex in 'ABCD':
+            self.assertEqual(bulk.get_neighbors(vertex), single.get_neighbors(vertex))
+        self.assertEqual(bulk.get_graph_info()['edges'], 4)
+
+
+class BidirectionalDijkstraTests(unittest.TestCase):
+    """dijkstra_bidirectional must agree with dijkstra on every shortest distance."""
+
+    def test_matches_dijkstra_on_random_graphs(self):
+        for seed in range(200):
+            graph = random_graph(seed)
+            vertices = sorted(graph.get_vertices())
+            for start in vertices:
+                for end in vertices:
+                    expected_path, expected = graph.dijkstra(start, end)
+                    path, distance = graph.dijkstra_bidirectional(start, end)
+                    self.assertEqual(distance, expected, (seed, start, end))
+                    self.assertEqual(bool(path), bool(expected_path), (seed, start, end))
+                    if path:
+                        self.assertEqual((path[0], path[-1]), (start, end))
+                        self.assertEqual(len(set(path)), len(path))
+                        self.assertEqual(path_length(graph, path), distance)
+
+    def test_directed_edges_are_only_walked_forwards(self):
+        graph = Graph()
+        graph.add_edges_from([('A', 'B', 1), ('C', 'B', 1), ('C', 'A', 10)], directed=True)
+        self.assertEqual(graph.dijkstra_bidirectional('A', 'C'), ([], float('inf')))
+        self.assertEqual(graph.dijkstra_bidirectional('C', 'A'), (['C', 'A'], 10))
+        self.assertEqual(graph.dijkstra_bidirectional('C', 'B'), (['C', 'B'], 1))
+
+    def test_matches_dijkstra_on_random_mixed_graphs(self):
+        for seed in range(200):
+            rng = random.Random(seed)
+            graph = random_graph(seed)
+            vertices = sorted(graph.get_vertices())
+            for _ in range(rng.randint(0, 15)):
+                graph.add_edge(rng.choice(vertices), rng.choice(vertices), rng.choice((0, 1, 2, 5)),
+                               directed=True)
+            for start in vertices:
+                for end in vertices:
+                    expected_path, expected = graph.dijkstra(start, end)
+                    path, distance = graph.dijkstra_bidirectional(start, end)
+                    self.assertEqual(distance, expected, (seed, start, end))
+                    self.assertEqual(bool(path), bool(expected_path), (seed, start, end))
+                    if path:
+                        self.assertEqual((path[0], path[-1]), (start, end))
+                        self.assertEqual(path_length(graph, path), distance)
+
+    def test_missing_vertices_and_same_vertex(self):
+        graph = random_graph(1)
+        self.assertEqual(graph.dijkstra_bidirectional('0', 'missing'), ([], float('inf')))
+        self.assertEqual(graph.dijkstra_bidirectional('0', '0'), (['0'], 0))
+
+    def test_campus_data(self):
+        from navigator import CampusNavigator
+        graph = CampusNavigator().graph
+        buildings = sorted(graph.get_vertices())
+        for start in buildings:
+            for end in buildings:
+                self.assertEqual(graph.dijkstra_bidirectional(start, end)[1],
+                                 graph.dijkstra(start, end)[1])
+
+
+class FindAllPathsTests(unittest.TestCase):
+    """find_all_paths must return the same paths, in the same order, as the original search."""
+
+    def test_matches_reference_on_random_graphs(self):
+        for seed in range(150):
+            graph = random_graph(seed, max_vertices=8, max_edges=16)
+            vertices = sorted(graph.get_vertices()) + ['missing']
+            for start in vertices:
+                for end in vertices:
+                    for max_paths in (1, 3, 10):
+                        self.assertEqual(graph.find_all_paths(start, end, max_paths),
+                                         reference_all_paths(graph, start, end, max_paths),
+                                         (seed, start, end, max_paths))
+
+    def test_campus_data(self):
+        from navigator import CampusNavigator
+        graph = CampusNavigator().graph
+        buildings = sorted(graph.get_vertices())
+        for start in buildings:
+            for end in buildings:
+                self.assertEqual(graph.find_all_paths(start, end),
+                                 reference_all_paths(graph, start, end))
+
+
+if __name__ == '__main__':
+    unittest.main()
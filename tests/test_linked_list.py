@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from data_structures.linked_list import DoublyLinkedList
+
+
+class DoublyLinkedListTests(unittest.TestCase):
+    """Positional operations must agree with a plain list, with or without a node snapshot."""
+
+    def test_random_operations_match_list(self):
+        for seed in range(100):
+            rng = random.Random(seed)
+            linked = DoublyLinkedList(indexed=seed % 2 == 0)
+            model = []
+            for _ in range(150):
+                operation = rng.randrange(8)
+                value = rng.randrange(6)
+                position = rng.randrange(-1, len(model) + 2)
+                if operation == 0:
+                    self.assertEqual(linked.insert_at_position(value, position), 0 <= position <= len(model))
+                    if 0 <= position <= len(model):
+                        model.insert(position, value)
+                elif operation == 1:
+                    expected = model.pop(position) if 0 <= position < len(model) else None
+                    self.assertEqual(linked.delete_at_position(position), expected)
+                elif operation == 2:
+                    expected = model[position] if 0 <= position < len(model) else None
+                    self.assertEqual(linked.get_at_position(position), expected)
+                elif operation == 3:
+                    self.assertEqual(linked.update_at_position(position, value), 0 <= position < len(model))
+                    if 0 <= position < len(model):
+                        model[position] = value
+                elif operation == 4:
+                    self.assertEqual(linked.delete_by_value(value), value in model)
+                    if value in model:
+                        model.remove(value)
+                elif operation == 5:
+                    self.assertEqual(linked.search(value), model.index(value) if value in model else None)
+                elif operation == 6:
+                    self.assertEqual(linked.to_list(), model)
+                else:
+                    linked.insert_at_end(value)
+                    model.append(value)
+                self.assertEqual(list(linked), model)
+                self.assertEqual(len(linked), len(model))
+
+    def test_to_list_does_not_build_the_snapshot(self):
+        linked = DoublyLinkedList.from_iterable(range(10))
+        self.assertEqual(linked.to_list(), list(range(10)))
+        self.assertIsNone(linked._nodes)
+
+    def test_snapshot_is_built_on_the_second_read_after_a_change(self):
+        linked = DoublyLinkedList.from_iterable(range(10))
+        self.assertEqual(linked.get_at_position(0), 0)
+        self.assertFalse(linked._nodes)
+        self.assertEqual(linked.get_at_position(9), 9)
+        self.assertEqual(len(linked._nodes), 10)
+        self.assertTrue(linked.update_at_position(9, 11))
+        self.assertEqual(len(linked._nodes), 10)
+        self.assertTrue(linked.insert_at_position(5, 1))
+        self.assertIsNone(linked._nodes)
+        self.assertEqual(linked.to_list(), [0, 5] + list(range(1, 9)) + [11])
+
+
+if __name__ == '__main__':
+    unittest.main()
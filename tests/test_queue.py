@@ -0,0 +1,64 @@
+import unittest
+
+from data_structures.queue import Queue
+
+
+class SetMaxSizeTests(unittest.TestCase):
+    """Resizing must trim the front in place and leave the queue fully usable."""
+
+    def test_shrink_then_enqueue_and_dequeue(self):
+        for indexed in (False, True):
+            queue = Queue(max_size=5, indexed=indexed)
+            items = queue.items
+            for item in range(5):
+                self.assertTrue(queue.enqueue(item))
+            self.assertFalse(queue.enqueue(5))
+
+            queue.set_max_size(3)
+            self.assertIs(queue.items, items)
+            self.assertEqual(queue.to_list(), [2, 3, 4])
+            self.assertTrue(queue.is_full())
+            self.assertFalse(queue.enqueue(5))
+            self.assertFalse(queue.contains(0))
+            self.assertTrue(queue.contains(2))
+
+            self.assertEqual(queue.dequeue(), 2)
+            self.assertTrue(queue.enqueue(5))
+            self.assertEqual(queue.to_list(), [3, 4, 5])
+            self.assertEqual(list(items), [3, 4, 5])
+
+    def test_grow_and_unbound(self):
+        queue = Queue(max_size=2)
+        queue.enqueue('a')
+        queue.enqueue('b')
+        queue.set_max_size(3)
+        self.assertTrue(queue.enqueue('c'))
+        self.assertFalse(queue.enqueue('d'))
+        queue.set_max_size(None)
+        for item in 'defg':
+            self.assertTrue(queue.enqueue(item))
+        self.assertFalse(queue.is_full())
+        self.assertEqual([queue.dequeue() for _ in range(7)], list('abcdefg'))
+        self.assertIsNone(queue.dequeue())
+
+    def test_shrink_to_zero(self):
+        queue = Queue()
+        queue.enqueue(1)
+        queue.set_max_size(0)
+        self.assertTrue(queue.is_empty())
+        self.assertTrue(queue.is_full())
+        self.assertFalse(queue.enqueue(2))
+
+    def test_negative_max_size_raises(self):
+        with self.assertRaises(ValueError):
+            Queue(max_size=-1)
+        queue = Queue(max_size=2)
+        queue.enqueue(1)
+        with self.assertRaises(ValueError):
+            queue.set_max_size(-1)
+        self.assertEqual(queue.get_max_size(), 2)
+        self.assertEqual(queue.to_list(), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()